@@ -1,4 +1,4 @@
-from pydantic import field_validator
+from pydantic import ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,6 +8,19 @@ class Settings(BaseSettings):
     app_name: str = "NakgoAlgo API"
     api_prefix: str = "/api"
     database_url: str = "sqlite:///./nakgo_algo.db"
+    async_database_url: str | None = None
+    database_read_pool_size: int = 8
+    database_write_pool_size: int = 1
+    sqlite_split_read_write: bool = True
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -20000
+    sql_instrumentation_enabled: bool = True
+    sql_debug_headers: bool = False
+    sql_repeated_statement_threshold: int = 10
+    sql_slow_request_ms: float = 200.0
     jwt_secret_key: str = ""
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60
@@ -17,10 +30,47 @@ class Settings(BaseSettings):
     cors_allow_credentials: bool = True
 
     max_request_size_bytes: int = 5 * 1024 * 1024
+    request_size_limits: dict[str, int] = {
+        "/api/auth": 16 * 1024,
+        "/api/profile": 16 * 1024,
+        "/api/notifications": 16 * 1024,
+        "/api/fish/check": 16 * 1024,
+        "/api/fish/check/batch": 512 * 1024,
+        "/api/points": 64 * 1024,
+        "/api/reports": 64 * 1024,
+        "POST /api/posts/": 64 * 1024,
+        "PUT /api/posts/": 64 * 1024,
+    }
     global_rate_limit_per_minute: int = 120
+    route_rate_limits_per_minute: dict[str, int] = {"POST /api/auth/kakao": 20, "POST /api/auth/refresh": 30}
+    rate_limit_backend: str = "memory"
+    rate_limit_sqlite_path: str = "./rate_limit_state.db"
     kakao_login_max_attempts: int = 8
     kakao_login_block_minutes: int = 10
 
+    kakao_api_base_url: str = "https://kapi.kakao.com"
+    kakao_http_timeout_seconds: float = 8.0
+    kakao_http_connect_timeout_seconds: float = 3.0
+    kakao_http_max_connections: int = 50
+    kakao_http_max_keepalive_connections: int = 20
+    kakao_profile_cache_ttl_seconds: int = 60
+    kakao_profile_cache_max_entries: int = 1000
+
+    principal_cache_max_entries: int = 10000
+    # Revocation clears only the handling worker's cache; other workers drop a revoked
+    # token when its cached entry expires, so this bounds the revocation delay.
+    principal_cache_ttl_seconds: int = 30
+
+    token_sweep_interval_seconds: int = 600
+    token_sweep_batch_size: int = 500
+
+    notification_stream_queue_size: int = 64
+    notification_stream_heartbeat_seconds: float = 15.0
+    notification_stream_max_seconds: int = 1800
+    notification_fanout_chunk_size: int = 1000
+
+    fish_check_batch_max_items: int = 5000
+
     @field_validator("jwt_secret_key")
     @classmethod
     def validate_jwt_secret_key(cls, value: str) -> str:
@@ -28,5 +78,36 @@ class Settings(BaseSettings):
             raise ValueError("JWT_SECRET_KEY must be set and at least 32 chars")
         return value
 
+    @field_validator("global_rate_limit_per_minute")
+    @classmethod
+    def validate_global_rate_limit(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("GLOBAL_RATE_LIMIT_PER_MINUTE must be at least 1")
+        return value
+
+    @field_validator("route_rate_limits_per_minute")
+    @classmethod
+    def validate_route_rate_limits(cls, value: dict[str, int]) -> dict[str, int]:
+        for pattern, limit in value.items():
+            if limit < 1:
+                raise ValueError(f"ROUTE_RATE_LIMITS_PER_MINUTE[{pattern!r}] must be at least 1")
+        return value
+
+    @field_validator("token_sweep_interval_seconds", "token_sweep_batch_size")
+    @classmethod
+    def validate_token_sweep(cls, value: int, info: ValidationInfo) -> int:
+        # A zero batch never finishes a sweep and a zero interval busy-loops the sweeper.
+        if value < 1:
+            raise ValueError(f"{info.field_name.upper()} must be at least 1")
+        return value
+
+    @field_validator("notification_stream_queue_size")
+    @classmethod
+    def validate_notification_stream_queue_size(cls, value: int) -> int:
+        # asyncio.Queue treats 0 as unbounded, which would let a stalled client buffer without limit.
+        if value < 1:
+            raise ValueError("NOTIFICATION_STREAM_QUEUE_SIZE must be at least 1")
+        return value
+
 
 settings = Settings()
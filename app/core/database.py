@@ -1,19 +1,121 @@
-from sqlalchemy import create_engine
+from functools import partial
+
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.schema import CreateColumn
 
 from app.core.config import settings
+from app.core.sql_stats import instrument_engine
+
+
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def _async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    async_driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if async_driver is None or url.drivername != url.get_backend_name():
+        return database_url
+    return url.set(drivername=async_driver).render_as_string(hide_password=False)
+
+
+def _is_file_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record, query_only: bool = False) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+        if query_only:
+            cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+def _create_async_engine(url: str, pool_size: int, query_only: bool) -> AsyncEngine:
+    if not _is_file_sqlite(url):
+        return create_async_engine(url)
+    async_engine = create_async_engine(url, pool_size=pool_size, max_overflow=0)
+    event.listen(async_engine.sync_engine, "connect", partial(_apply_sqlite_pragmas, query_only=query_only))
+    return async_engine
 
 
 connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
 
+# The sync engine serves startup (schema creation, seeding) and offline scripts;
+# request handlers use the async engines below.
 engine = create_engine(settings.database_url, connect_args=connect_args)
+if _is_file_sqlite(settings.database_url):
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# SQLite allows one writer at a time, so mutations share a small writer pool while
+# GET routes read from a separate query_only pool that WAL lets run alongside it.
+_async_url = settings.async_database_url or _async_database_url(settings.database_url)
+async_engine = _create_async_engine(_async_url, settings.database_write_pool_size, query_only=False)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+if settings.sqlite_split_read_write and _is_file_sqlite(_async_url):
+    read_async_engine = _create_async_engine(_async_url, settings.database_read_pool_size, query_only=True)
+else:
+    read_async_engine = async_engine
+ReadSessionLocal = async_sessionmaker(read_async_engine, autoflush=False, expire_on_commit=False)
+if settings.sql_instrumentation_enabled:
+    for _instrumented in {engine, async_engine.sync_engine, read_async_engine.sync_engine}:
+        instrument_engine(_instrumented)
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def get_read_db():
+    async with ReadSessionLocal() as db:
+        yield db
+
+
+def create_missing_columns() -> set[str]:
+    """Add columns declared on models that an existing table lacks; return them as ``table.column``.
+
+    ``create_all`` skips tables that already exist, so a column added to a model later
+    never reaches a database created by an earlier release. New columns are filled from
+    their ``server_default``; callers recompute any derived values after this runs.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = set()
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    raise RuntimeError(f"{table.name}.{column.name} is NOT NULL without a server default")
+                table_name = engine.dialect.identifier_preparer.format_table(table)
+                column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_ddl}"))
+                added.add(f"{table.name}.{column.name}")
+    return added
+
+
+def create_missing_indexes() -> None:
+    """Create indexes declared on models that an existing database predates.
+
+    ``create_all`` only emits indexes together with their table, so indexes added
+    to a model later never reach a database created by an earlier release.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
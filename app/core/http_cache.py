@@ -0,0 +1,50 @@
+import hashlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+
+from app.core.responses import encode_json
+
+
+# Clients may keep a copy but must revalidate it; a matching ETag costs a 304 with no body.
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedBody:
+    body: bytes
+    etag: str
+
+
+def encode_once(cache: dict[str, EncodedBody], key: str, version: int, build: Callable[[], Any]) -> EncodedBody:
+    """Return the JSON body for ``key`` from ``cache``, encoding ``build()`` the first time.
+
+    The ETag pairs the data version with a digest of the bytes, so it stays correct
+    across restarts (where versions start over) and differs between workers only
+    when their data does.
+    """
+    encoded = cache.get(key)
+    if encoded is None:
+        body = encode_json(build())
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        encoded = EncodedBody(body=body, etag=f'"v{version}-{digest}"')
+        cache[key] = encoded
+    return encoded
+
+
+def cached_json_response(request: Request, encoded: EncodedBody) -> Response:
+    headers = {"ETag": encoded.etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), encoded.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix added by a proxy still matches.
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
@@ -1,117 +1,292 @@
-from collections import defaultdict, deque
+import logging
+import math
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
-from threading import Lock
+from typing import TypeVar
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.core.rate_limit import RateLimitRule, rate_limit_backend
+from app.core.sql_stats import SqlStats, current_sql_stats
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(self)"
-        response.headers["X-XSS-Protection"] = "0"
-        return response
+T = TypeVar("T")
 
+sql_logger = logging.getLogger("app.sql")
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        content_length = request.headers.get("content-length")
+
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "geolocation=(self)",
+    "X-XSS-Protection": "0",
+}
+
+
+class SecurityHeadersMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=list(message.get("headers", [])))
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+                message["headers"] = headers.raw
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
+
+
+class SqlStatsMiddleware:
+    """Attributes SQL statements to the request that issued them.
+
+    Statement count, total DB time and the slowest statement are logged for every
+    request (DEBUG, or WARNING when the request is slow or repeats one statement shape
+    more than ``sql_repeated_statement_threshold`` times) and, with
+    ``sql_debug_headers``, returned as ``X-DB-*`` response headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.sql_instrumentation_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        stats = SqlStats()
+        token = current_sql_stats.set(stats)
+
+        async def send_with_sql_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.sql_debug_headers:
+                headers = MutableHeaders(raw=list(message.get("headers", [])))
+                headers["X-DB-Statements"] = str(stats.statements)
+                headers["X-DB-Time-Ms"] = f"{stats.total_seconds * 1000:.2f}"
+                headers["X-DB-Slowest-Ms"] = f"{stats.slowest_seconds * 1000:.2f}"
+                repeated = stats.repeated_statement(settings.sql_repeated_statement_threshold)
+                if repeated is not None:
+                    headers["X-DB-Repeated-Statement"] = str(repeated[1])
+                message["headers"] = headers.raw
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_sql_headers)
+        finally:
+            current_sql_stats.reset(token)
+            _log_sql_stats(scope, stats)
+
+
+def _log_sql_stats(scope: Scope, stats: SqlStats) -> None:
+    repeated = stats.repeated_statement(settings.sql_repeated_statement_threshold)
+    slow = stats.total_seconds * 1000 >= settings.sql_slow_request_ms
+    level = logging.WARNING if repeated is not None or slow else logging.DEBUG
+    if not sql_logger.isEnabledFor(level):
+        return
+
+    fields = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "db_statements": stats.statements,
+        "db_time_ms": round(stats.total_seconds * 1000, 2),
+        "db_slowest_ms": round(stats.slowest_seconds * 1000, 2),
+        "db_slowest_statement": stats.slowest_statement,
+        "db_repeated_statement": repeated[0] if repeated else None,
+        "db_repeated_count": repeated[1] if repeated else 0,
+    }
+    message = "%s %s: %d statements in %.2fms (slowest %.2fms)"
+    args = [fields["method"], fields["path"], stats.statements, fields["db_time_ms"], fields["db_slowest_ms"]]
+    if repeated is not None:
+        message += "; possible N+1, statement repeated %d times: %s"
+        args += [repeated[1], repeated[0]]
+    sql_logger.log(level, message, *args, extra=fields)
+
+
+class RequestBodyTooLarge(Exception):
+    pass
+
+
+class RequestSizeLimitMiddleware:
+    """Enforces a per-route request body budget while the body streams in.
+
+    ``Content-Length`` is checked up front, and the bytes actually received are
+    counted as well, so chunked uploads or a lying header are cut off with 413 as
+    soon as the budget is exceeded instead of being buffered by the route.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.route_budgets = _build_route_table(settings.request_size_limits, lambda _, budget: budget)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = _match_route(self.route_budgets, scope["method"], scope["path"]) or settings.max_request_size_bytes
+        content_length = Headers(scope=scope).get("content-length")
         if content_length:
             try:
-                if int(content_length) > settings.max_request_size_bytes:
-                    return JSONResponse(
-                        status_code=413,
-                        content={"message": "요청 본문이 너무 큽니다.", "code": "REQUEST_TOO_LARGE"},
-                    )
+                if int(content_length) > budget:
+                    await _request_too_large_response(scope, receive, send)
+                    return
             except ValueError:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=400,
                     content={"message": "잘못된 Content-Length 값입니다.", "code": "INVALID_CONTENT_LENGTH"},
                 )
+                await response(scope, receive, send)
+                return
 
-        return await call_next(request)
-
-
-class GlobalRateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        self.lock = Lock()
-        self.window_seconds = 60
-        self.limit_per_window = settings.global_rate_limit_per_minute
-        self.request_history: dict[str, deque[float]] = defaultdict(deque)
-
-    async def dispatch(self, request: Request, call_next):
-        client_ip = _get_client_ip(request)
-        now = datetime.now(timezone.utc).timestamp()
-        cutoff = now - self.window_seconds
-
-        with self.lock:
-            history = self.request_history[client_ip]
-            while history and history[0] <= cutoff:
-                history.popleft()
-
-            if len(history) >= self.limit_per_window:
-                retry_after = int(max(1, self.window_seconds - (now - history[0])))
-                return JSONResponse(
-                    status_code=429,
-                    content={"message": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.", "code": "RATE_LIMITED"},
-                    headers={"Retry-After": str(retry_after)},
-                )
+        received = 0
+        exceeded = False
+        response_started = False
+        response_replaced = False
+
+        async def receive_within_budget() -> Message:
+            nonlocal received, exceeded
+            if exceeded:
+                raise RequestBodyTooLarge()
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > budget:
+                    exceeded = True
+                    raise RequestBodyTooLarge()
+            return message
+
+        async def send_unless_exceeded(message: Message) -> None:
+            nonlocal response_started, response_replaced
+            if message["type"] == "http.response.start":
+                response_started = True
+                if exceeded:
+                    # The app turned the aborted read into its own error response; answer 413 instead.
+                    response_replaced = True
+                    await _request_too_large_response(scope, receive, send)
+                    return
+            if not response_replaced:
+                await send(message)
+
+        try:
+            await self.app(scope, receive_within_budget, send_unless_exceeded)
+        except RequestBodyTooLarge:
+            if not response_started:
+                await _request_too_large_response(scope, receive, send)
+
+
+class GlobalRateLimitMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.limiter = rate_limit_backend
+        self.global_rule = RateLimitRule(name="global", limit=settings.global_rate_limit_per_minute)
+        self.route_rules = _build_route_table(
+            settings.route_rate_limits_per_minute,
+            lambda pattern, limit: RateLimitRule(name=pattern, limit=limit),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = _client_ip_from_scope(scope)
+        retry_after = self.limiter.hit(self.global_rule, client_ip)
+        if not retry_after:
+            route_rule = _match_route(self.route_rules, scope["method"], scope["path"])
+            if route_rule is not None:
+                retry_after = self.limiter.hit(route_rule, client_ip)
 
-            history.append(now)
+        if retry_after:
+            response = JSONResponse(
+                status_code=429,
+                content={"message": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.", "code": "RATE_LIMITED"},
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
+
+
+def _build_route_table(
+    values: dict[str, int], build: Callable[[str, int], T]
+) -> list[tuple[str | None, str, T]]:
+    """Turn ``{"METHOD /prefix": value}`` settings into a longest-prefix-first lookup table."""
+    table = []
+    for pattern, value in values.items():
+        method, _, path = pattern.strip().rpartition(" ")
+        table.append((method.upper() or None, path, build(pattern, value)))
+    table.sort(key=lambda entry: len(entry[1]), reverse=True)
+    return table
+
+
+def _match_route(table: list[tuple[str | None, str, T]], method: str, path: str) -> T | None:
+    for entry_method, prefix, value in table:
+        if (entry_method is None or entry_method == method) and path.startswith(prefix):
+            return value
+    return None
+
+
+async def _request_too_large_response(scope: Scope, receive: Receive, send: Send) -> None:
+    response = JSONResponse(
+        status_code=413,
+        content={"message": "요청 본문이 너무 큽니다.", "code": "REQUEST_TOO_LARGE"},
+    )
+    await response(scope, receive, send)
 
 
 def _get_client_ip(request: Request) -> str:
-    x_forwarded_for = request.headers.get("x-forwarded-for")
+    return _client_ip_from_scope(request.scope)
+
+
+def _client_ip_from_scope(scope: Scope) -> str:
+    x_forwarded_for = Headers(scope=scope).get("x-forwarded-for")
     if x_forwarded_for:
         return x_forwarded_for.split(",")[0].strip()
-    if request.client:
-        return request.client.host
+    client = scope.get("client")
+    if client:
+        return client[0]
     return "unknown"
 
 
 class KakaoLoginGuard:
-    def __init__(self):
-        self.lock = Lock()
-        self.failures: dict[str, deque[float]] = defaultdict(deque)
-        self.blocked_until: dict[str, float] = {}
+    """Blocks an IP after ``kakao_login_max_attempts`` failed logins in quick succession.
+
+    The failure budget refills over five minutes. State lives in the shared
+    rate-limit backend so every worker enforces the same lockout.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.failure_rule = RateLimitRule(
+            name="kakao-login-failures",
+            limit=max(1, settings.kakao_login_max_attempts - 1),
+            period_seconds=300,
+        )
 
     def assert_allowed(self, ip: str) -> None:
-        now = datetime.now(timezone.utc).timestamp()
-        with self.lock:
-            blocked_until = self.blocked_until.get(ip)
-            if blocked_until and now < blocked_until:
-                raise PermissionError("TOO_MANY_LOGIN_FAILURES")
-            if blocked_until and now >= blocked_until:
-                self.blocked_until.pop(ip, None)
+        if self.backend.get_block("kakao-login", ip) is not None:
+            raise PermissionError("TOO_MANY_LOGIN_FAILURES")
 
     def record_failure(self, ip: str) -> None:
-        now = datetime.now(timezone.utc).timestamp()
-        cutoff = now - 300
-        with self.lock:
-            bucket = self.failures[ip]
-            while bucket and bucket[0] <= cutoff:
-                bucket.popleft()
-            bucket.append(now)
-
-            if len(bucket) >= settings.kakao_login_max_attempts:
-                blocked_until = datetime.now(timezone.utc) + timedelta(minutes=settings.kakao_login_block_minutes)
-                self.blocked_until[ip] = blocked_until.timestamp()
-                self.failures[ip].clear()
+        if self.backend.hit(self.failure_rule, ip):
+            blocked_until = datetime.now(timezone.utc) + timedelta(minutes=settings.kakao_login_block_minutes)
+            self.backend.set_block("kakao-login", ip, blocked_until.timestamp())
+            self.backend.reset(self.failure_rule, ip)
 
     def record_success(self, ip: str) -> None:
-        with self.lock:
-            self.failures.pop(ip, None)
-            self.blocked_until.pop(ip, None)
+        self.backend.reset(self.failure_rule, ip)
+        self.backend.clear_block("kakao-login", ip)
 
 
-kakao_login_guard = KakaoLoginGuard()
+kakao_login_guard = KakaoLoginGuard(rate_limit_backend)
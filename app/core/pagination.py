@@ -0,0 +1,114 @@
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Sequence, TypeVar
+
+from fastapi import Query
+from sqlalchemy import Select, and_, or_
+
+from app.core.errors import bad_request
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+# Largest value SQLite (and a BIGINT) can bind; a forged cursor beyond it would fail at query time.
+MAX_SQL_INTEGER = 2**63 - 1
+
+RowT = TypeVar("RowT")
+
+
+@dataclass(frozen=True, slots=True)
+class PageParams:
+    cursor: str | None
+    limit: int
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    created_at: datetime
+    id: int
+
+
+def page_params(
+    cursor: str | None = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PageParams:
+    return PageParams(cursor=cursor, limit=limit)
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode("utf-8")
+        created_at, row_id = raw.rsplit("|", 1)
+        cursor = Cursor(created_at=datetime.fromisoformat(created_at), id=int(row_id))
+        if not 1 <= cursor.id <= MAX_SQL_INTEGER:
+            raise ValueError(raw)
+        return cursor
+    except ValueError:
+        raise bad_request("유효하지 않은 커서입니다.", "INVALID_CURSOR")
+
+
+def encode_offset_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset|{offset}".encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_offset_cursor(value: str | None) -> int:
+    """Offset cursors back result sets with no stable sort key, such as relevance-ranked search."""
+    if not value:
+        return 0
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode("utf-8")
+        kind, offset = raw.split("|", 1)
+        # The search query binds offset + limit + 1, so keep that sum within range as well.
+        if kind != "offset" or not 0 <= int(offset) <= MAX_SQL_INTEGER - MAX_PAGE_SIZE - 1:
+            raise ValueError(raw)
+        return int(offset)
+    except ValueError:
+        raise bad_request("유효하지 않은 커서입니다.", "INVALID_CURSOR")
+
+
+def keyset_page(query: Select, created_at_column, id_column, page: PageParams, descending: bool = True) -> Select:
+    """Order ``query`` by (created_at, id), seek past ``page.cursor`` and fetch one extra row.
+
+    The seek is written as ``created_at <= x AND (created_at < x OR id < y)`` rather than
+    a plain OR so SQLite can turn the first term into an index range and start reading at
+    the cursor instead of skipping every row before it.
+    """
+    if page.cursor:
+        cursor = decode_cursor(page.cursor)
+        if descending:
+            query = query.where(
+                and_(
+                    created_at_column <= cursor.created_at,
+                    or_(created_at_column < cursor.created_at, id_column < cursor.id),
+                )
+            )
+        else:
+            query = query.where(
+                and_(
+                    created_at_column >= cursor.created_at,
+                    or_(created_at_column > cursor.created_at, id_column > cursor.id),
+                )
+            )
+    if descending:
+        query = query.order_by(created_at_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(created_at_column.asc(), id_column.asc())
+    return query.limit(page.limit + 1)
+
+
+def split_page(
+    rows: Sequence[RowT],
+    page: PageParams,
+    key: Callable[[RowT], tuple[datetime, int]],
+) -> tuple[Sequence[RowT], str | None]:
+    """Trim the look-ahead row from ``keyset_page`` results and build the next cursor."""
+    if len(rows) <= page.limit:
+        return rows, None
+    rows = rows[: page.limit]
+    return rows, encode_cursor(*key(rows[-1]))
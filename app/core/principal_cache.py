@@ -0,0 +1,125 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from threading import Lock
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: int
+    nickname: str
+    email: str | None
+    profile_image: str | None
+    role: str
+    token_version: int
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            nickname=user.nickname,
+            email=user.email,
+            profile_image=user.profile_image,
+            role=user.role,
+            token_version=user.token_version,
+        )
+
+
+class PrincipalCache:
+    """Bounded LRU of verified access-token principals keyed by token hash.
+
+    The cache is per process. ``invalidate_user`` only reaches the worker that calls it,
+    so other workers keep accepting a revoked token for up to ``max_ttl_seconds``.
+    """
+
+    def __init__(self, max_entries: int, max_ttl_seconds: int):
+        self.lock = Lock()
+        self.max_entries = max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        self.entries: OrderedDict[str, tuple[Principal, float]] = OrderedDict()
+        self.keys_by_user: dict[int, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> Principal | None:
+        key = _token_key(token)
+        now = datetime.now(timezone.utc).timestamp()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            principal, expires_at = entry
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def put(self, token: str, principal: Principal, token_exp: float) -> None:
+        if self.max_entries <= 0:
+            return
+        key = _token_key(token)
+        now = datetime.now(timezone.utc).timestamp()
+        expires_at = min(token_exp, now + self.max_ttl_seconds)
+        if expires_at <= now:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (principal, expires_at)
+            self.keys_by_user.setdefault(principal.id, set()).add(key)
+            while len(self.entries) > self.max_entries:
+                oldest_key = next(iter(self.entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, token: str) -> None:
+        with self.lock:
+            self._remove(_token_key(token))
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self.lock:
+            for key in list(self.keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.keys_by_user.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[0].id
+        keys = self.keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self.keys_by_user.pop(user_id, None)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.principal_cache_max_entries,
+    max_ttl_seconds=settings.principal_cache_ttl_seconds,
+)
@@ -0,0 +1,241 @@
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitRule:
+    name: str
+    limit: int
+    period_seconds: float = 60.0
+
+    def __post_init__(self):
+        if self.limit < 1:
+            raise ValueError(f"Rate limit {self.name!r} must allow at least 1 request per period")
+
+    @property
+    def emission_interval(self) -> float:
+        return self.period_seconds / self.limit
+
+
+class MemoryRateLimitBackend:
+    """In-process GCRA state: one timestamp per key in a sharded table.
+
+    All operations are O(1), lock-free and meant to be called from the event loop.
+    Every entry is a point in time after which it carries no state (a GCRA
+    theoretical arrival time or a block deadline), so idle keys are evicted
+    incrementally: one shard is swept per ``sweep_cycle_seconds / shard_count``,
+    which walks the whole table once per cycle.
+    """
+
+    def __init__(self, shard_count: int = 256, sweep_cycle_seconds: float = 60.0):
+        if shard_count & (shard_count - 1):
+            raise ValueError("shard_count must be a power of two")
+        self.shard_mask = shard_count - 1
+        self.shards: list[dict[str, float]] = [{} for _ in range(shard_count)]
+        self.sweep_interval = sweep_cycle_seconds / shard_count
+        self.next_sweep_at = 0.0
+        self.sweep_cursor = 0
+
+    def hit(self, rule: RateLimitRule, key: str, now: float | None = None) -> float:
+        """Consume one request for ``key``; return 0 if allowed, otherwise seconds until retry."""
+        if now is None:
+            now = time.time()
+        if now >= self.next_sweep_at:
+            self.next_sweep_at = now + self.sweep_interval
+            self._sweep_next_shard(now)
+
+        table_key = f"{rule.name}|{key}"
+        shard = self._shard(table_key)
+        tat = shard.get(table_key, now)
+        if tat < now:
+            tat = now
+        new_tat = tat + rule.emission_interval
+        allow_at = new_tat - rule.period_seconds
+        if now < allow_at:
+            return allow_at - now
+        shard[table_key] = new_tat
+        return 0.0
+
+    def reset(self, rule: RateLimitRule, key: str) -> None:
+        table_key = f"{rule.name}|{key}"
+        self._shard(table_key).pop(table_key, None)
+
+    def get_block(self, name: str, key: str, now: float | None = None) -> float | None:
+        if now is None:
+            now = time.time()
+        table_key = f"block:{name}|{key}"
+        until = self._shard(table_key).get(table_key)
+        return until if until is not None and until > now else None
+
+    def set_block(self, name: str, key: str, until: float) -> None:
+        table_key = f"block:{name}|{key}"
+        self._shard(table_key)[table_key] = until
+
+    def clear_block(self, name: str, key: str) -> None:
+        table_key = f"block:{name}|{key}"
+        self._shard(table_key).pop(table_key, None)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def _shard(self, table_key: str) -> dict[str, float]:
+        return self.shards[hash(table_key) & self.shard_mask]
+
+    def _sweep_next_shard(self, now: float) -> None:
+        shard = self.shards[self.sweep_cursor]
+        self.sweep_cursor = (self.sweep_cursor + 1) & self.shard_mask
+        idle_keys = [key for key, value in shard.items() if value <= now]
+        for key in idle_keys:
+            del shard[key]
+
+
+class SqliteRateLimitBackend:
+    """GCRA state in a host-local SQLite file shared by every worker process.
+
+    Each decision is a single UPSERT, so concurrent workers see one consistent
+    budget. The database only holds ephemeral limiter state, so it runs with
+    WAL and synchronous=OFF; a call costs tens of microseconds on the event loop.
+
+    Calls run on the event loop, so nothing here may wait long: lock waits are capped
+    at ``busy_timeout_ms`` and a call that can't get the lock fails open (the request
+    is allowed, a block is not recorded). Expired rows are deleted ``sweep_batch_size``
+    at a time through an index on ``value``; a full batch schedules the next one for
+    the following call, so a large backlog drains in small steps.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sweep_interval_seconds: float = 60.0,
+        sweep_batch_size: int = 500,
+        busy_timeout_ms: int = 5,
+    ):
+        self.path = path
+        self.sweep_interval = sweep_interval_seconds
+        self.sweep_batch_size = sweep_batch_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self.next_sweep_at = 0.0
+        self.connection: sqlite3.Connection | None = None
+
+    def hit(self, rule: RateLimitRule, key: str, now: float | None = None) -> float:
+        if now is None:
+            now = time.time()
+        table_key = f"{rule.name}|{key}"
+        params = {
+            "key": table_key,
+            "now": now,
+            "interval": rule.emission_interval,
+            "period": rule.period_seconds,
+        }
+        try:
+            connection = self._connect(now)
+            allowed = connection.execute(
+                """
+                INSERT INTO rate_limit_state (key, value) VALUES (:key, :now + :interval)
+                ON CONFLICT (key) DO UPDATE SET value = max(value, :now) + :interval
+                WHERE max(value, :now) + :interval - :period <= :now
+                RETURNING value
+                """,
+                params,
+            ).fetchone()
+            if allowed is not None:
+                return 0.0
+            row = connection.execute("SELECT value FROM rate_limit_state WHERE key = ?", (table_key,)).fetchone()
+        except sqlite3.OperationalError as exc:
+            logger.warning("Rate limit state unavailable, allowing request: %s", exc)
+            return 0.0
+        if row is None:
+            return 0.0
+        return max(0.0, max(row[0], now) + rule.emission_interval - rule.period_seconds - now)
+
+    def reset(self, rule: RateLimitRule, key: str) -> None:
+        self._delete(f"{rule.name}|{key}")
+
+    def get_block(self, name: str, key: str, now: float | None = None) -> float | None:
+        if now is None:
+            now = time.time()
+        try:
+            row = self._connect(now).execute(
+                "SELECT value FROM rate_limit_state WHERE key = ? AND value > ?",
+                (f"block:{name}|{key}", now),
+            ).fetchone()
+        except sqlite3.OperationalError as exc:
+            logger.warning("Rate limit state unavailable, ignoring block: %s", exc)
+            return None
+        return row[0] if row else None
+
+    def set_block(self, name: str, key: str, until: float) -> None:
+        try:
+            self._connect(time.time()).execute(
+                """
+                INSERT INTO rate_limit_state (key, value) VALUES (?, ?)
+                ON CONFLICT (key) DO UPDATE SET value = excluded.value
+                """,
+                (f"block:{name}|{key}", until),
+            )
+        except sqlite3.OperationalError as exc:
+            logger.warning("Rate limit state unavailable, block not recorded: %s", exc)
+
+    def clear_block(self, name: str, key: str) -> None:
+        self._delete(f"block:{name}|{key}")
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _delete(self, table_key: str) -> None:
+        try:
+            self._connect(time.time()).execute("DELETE FROM rate_limit_state WHERE key = ?", (table_key,))
+        except sqlite3.OperationalError as exc:
+            logger.warning("Rate limit state unavailable, key not cleared: %s", exc)
+
+    def _connect(self, now: float) -> sqlite3.Connection:
+        if self.connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_state (key TEXT PRIMARY KEY, value REAL NOT NULL) WITHOUT ROWID"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS rate_limit_state_value ON rate_limit_state (value)")
+            self.connection = connection
+        if now >= self.next_sweep_at:
+            self._sweep(now)
+        return self.connection
+
+    def _sweep(self, now: float) -> None:
+        self.next_sweep_at = now + self.sweep_interval
+        try:
+            deleted = self.connection.execute(
+                """
+                DELETE FROM rate_limit_state WHERE key IN (
+                    SELECT key FROM rate_limit_state WHERE value <= ? LIMIT ?
+                )
+                """,
+                (now, self.sweep_batch_size),
+            ).rowcount
+        except sqlite3.OperationalError:
+            # Another worker holds the lock; sweeping can wait for the next interval.
+            return
+        if deleted >= self.sweep_batch_size:
+            self.next_sweep_at = now
+
+
+def create_rate_limit_backend() -> MemoryRateLimitBackend | SqliteRateLimitBackend:
+    if settings.rate_limit_backend == "sqlite":
+        return SqliteRateLimitBackend(settings.rate_limit_sqlite_path)
+    if settings.rate_limit_backend == "memory":
+        return MemoryRateLimitBackend()
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {settings.rate_limit_backend}")
+
+
+rate_limit_backend = create_rate_limit_backend()
@@ -0,0 +1,28 @@
+from typing import Any
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: same compact UTF-8 output as ``JSONResponse``, encoded by orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode schema objects (or lists/dicts of them) straight to JSON bytes, without re-validating."""
+    return to_json(content, by_alias=True)
+
+
+def model_response(content: Any, status_code: int = 200) -> Response:
+    """Send schema objects the route already built as-is.
+
+    Returning a ``Response`` makes FastAPI skip validating the value against
+    ``response_model`` again; the decorator's ``response_model`` still documents the
+    route. Use it only where every item is constructed from the schema class itself.
+    """
+    return Response(content=encode_json(content), status_code=status_code, media_type="application/json")
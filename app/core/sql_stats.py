@@ -0,0 +1,58 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+
+
+@dataclass(slots=True)
+class SqlStats:
+    """Statements executed while serving one request."""
+
+    statements: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.total_seconds += seconds
+        self.shapes[statement] += 1
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def repeated_statement(self, threshold: int) -> tuple[str, int] | None:
+        """The most repeated statement shape if it ran more than ``threshold`` times (an N+1 smell)."""
+        if not self.shapes:
+            return None
+        statement, count = self.shapes.most_common(1)[0]
+        return (statement, count) if count > threshold else None
+
+
+current_sql_stats: ContextVar[SqlStats | None] = ContextVar("current_sql_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    # The start time lives on the execution context rather than the connection, so a
+    # statement that raises (and never reaches after_cursor_execute) leaves nothing behind.
+    if context is not None and current_sql_stats.get() is not None:
+        context.sql_stats_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = current_sql_stats.get()
+    started = getattr(context, "sql_stats_started", None)
+    if stats is None or started is None:
+        return
+    # Bound parameters are not part of the text, so the same query with different
+    # values counts as one shape.
+    stats.record(statement, time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attribute every statement run on ``engine`` to the request in ``current_sql_stats``."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -9,11 +9,43 @@ from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.core.config import settings
-from app.core.database import Base, SessionLocal, engine
-from app.core.middleware import GlobalRateLimitMiddleware, RequestSizeLimitMiddleware, SecurityHeadersMiddleware
-from app.routers import auth, fish, fines, notifications, points, posts, profile, regulations, reports, zones
+from app.core.database import (
+    Base,
+    SessionLocal,
+    async_engine,
+    create_missing_columns,
+    create_missing_indexes,
+    engine,
+    read_async_engine,
+)
+from app.core.middleware import (
+    GlobalRateLimitMiddleware,
+    RequestSizeLimitMiddleware,
+    SecurityHeadersMiddleware,
+    SqlStatsMiddleware,
+)
+from app.core.responses import FastJSONResponse
+from app.routers import (
+    auth,
+    fines,
+    fish,
+    notifications,
+    points,
+    posts,
+    profile,
+    reference_data as reference_data_router,
+    regulations,
+    reports,
+    zones,
+)
+from app.services.comment_counts import recount_comment_counts
+from app.services.kakao_client import kakao_client
+from app.services.notification_fanout import notification_fanout
+from app.services.notification_service import recount_unread_counts
+from app.services.post_search import post_search_index
+from app.services.reference_data import reference_data
 from app.services.seed import seed_reference_data
-from app.services.token_service import cleanup_expired_tokens
+from app.services.token_sweeper import token_sweeper
 
 
 logger = logging.getLogger(__name__)
@@ -22,16 +54,34 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     Base.metadata.create_all(bind=engine)
+    added_columns = create_missing_columns()
+    create_missing_indexes()
+    post_search_index.install(engine)
     db = SessionLocal()
     try:
+        # Counter columns added to an existing database start at 0; fill them from the source rows.
+        if "posts.comment_count" in added_columns:
+            recount_comment_counts(db)
+        if "users.unread_notification_count" in added_columns:
+            recount_unread_counts(db)
         seed_reference_data(db)
-        cleanup_expired_tokens(db)
     finally:
         db.close()
-    yield
+    await reference_data.reload()
+    await kakao_client.start()
+    token_sweeper.start()
+    try:
+        yield
+    finally:
+        await notification_fanout.stop()
+        await token_sweeper.stop()
+        await kakao_client.close()
+        await async_engine.dispose()
+        if read_async_engine is not async_engine:
+            await read_async_engine.dispose()
 
 
-app = FastAPI(title=settings.app_name, lifespan=lifespan)
+app = FastAPI(title=settings.app_name, lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -43,6 +93,7 @@ app.add_middleware(
 app.add_middleware(GlobalRateLimitMiddleware)
 app.add_middleware(RequestSizeLimitMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(SqlStatsMiddleware)
 
 
 @app.exception_handler(HTTPException)
@@ -79,6 +130,7 @@ app.include_router(posts.router, prefix=settings.api_prefix)
 app.include_router(notifications.router, prefix=settings.api_prefix)
 app.include_router(reports.router, prefix=settings.api_prefix)
 app.include_router(zones.router, prefix=settings.api_prefix)
+app.include_router(reference_data_router.router, prefix=settings.api_prefix)
 
 uploads_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "uploads")
 os.makedirs(uploads_dir, exist_ok=True)
@@ -7,7 +7,6 @@ from app.models.post import Post
 from app.models.refresh_token import RefreshToken
 from app.models.regulation import Regulation
 from app.models.report import Report
-from app.models.token_blocklist import TokenBlocklist
 from app.models.user import User
 from app.models.zone import Zone
 
@@ -21,7 +20,6 @@ __all__ = [
     "RefreshToken",
     "Regulation",
     "Report",
-    "TokenBlocklist",
     "User",
     "Zone",
 ]
@@ -1,14 +0,0 @@
-from datetime import datetime
-
-from sqlalchemy import DateTime, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
-
-from app.core.database import Base
-
-
-class TokenBlocklist(Base):
-    __tablename__ = "token_blocklist"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    token: Mapped[str] = mapped_column(String(2048), unique=True, nullable=False, index=True)
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
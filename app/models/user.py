@@ -15,6 +15,8 @@ class User(Base):
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
     profile_image: Mapped[str | None] = mapped_column(String(500), nullable=True)
     role: Mapped[str] = mapped_column(String(20), default="user", nullable=False)
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    unread_notification_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     points = relationship("Point", back_populates="user", cascade="all, delete-orphan")
@@ -1,16 +1,20 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Request
 
-from app.core.database import get_db
-from app.models import Fine
+from app.core.http_cache import cached_json_response, encode_once
 from app.schemas.fine import FineResponse
+from app.services.reference_data import reference_data
 
 router = APIRouter(prefix="/fines", tags=["fines"])
 
 
 @router.get("", response_model=list[FineResponse])
-def list_fines(db: Session = Depends(get_db)):
-    rows = db.query(Fine).order_by(Fine.id.asc()).all()
+async def list_fines(request: Request):
+    snapshot = await reference_data.get()
+    encoded = encode_once(snapshot.encoded, "fines", snapshot.version, lambda: _fine_items(snapshot.fines))
+    return cached_json_response(request, encoded)
+
+
+def _fine_items(rows) -> list[FineResponse]:
     return [
         FineResponse(
             id=row.id,
@@ -1,25 +1,28 @@
 import hashlib
 from datetime import datetime
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Request
 
-from app.core.database import get_db
-from app.core.errors import not_found
-from app.models import FishSpecies
+from app.core.config import settings
+from app.core.errors import bad_request, not_found
+from app.core.http_cache import cached_json_response, encode_once
+from app.core.responses import FastJSONResponse
 from app.schemas.fish import (
     FishAnalyzeRequest,
     FishAnalyzeResponse,
+    FishCheckBatchRequest,
+    FishCheckBatchResponse,
     FishCheckRequest,
     FishCheckResponse,
     FishRegulationInfo,
     FishSpeciesItem,
 )
+from app.services.reference_data import RegulationRecord, SpeciesRecord, reference_data
 
 router = APIRouter(prefix="/fish", tags=["fish"])
 
 
-def _build_regulation_description(min_length: int, banned_months: list[int]) -> str:
+def _build_regulation_description(min_length: int, banned_months: tuple[int, ...]) -> str:
     if not banned_months:
         return f"최소 체장 {min_length}cm"
     sorted_months = sorted(set(banned_months))
@@ -28,8 +31,8 @@ def _build_regulation_description(min_length: int, banned_months: list[int]) ->
 
 
 @router.post("/analyze", response_model=FishAnalyzeResponse)
-def analyze_fish(payload: FishAnalyzeRequest, db: Session = Depends(get_db)):
-    species_rows = db.query(FishSpecies).order_by(FishSpecies.id.asc()).all()
+async def analyze_fish(payload: FishAnalyzeRequest):
+    species_rows = (await reference_data.get()).species
     if not species_rows:
         raise not_found("어종 데이터가 없습니다.", "FISH_SPECIES_NOT_FOUND")
 
@@ -40,48 +43,105 @@ def analyze_fish(payload: FishAnalyzeRequest, db: Session = Depends(get_db)):
     confidence = 0.75 + ((int(digest[8:10], 16) % 20) / 100)
     regulation = FishRegulationInfo(
         minLength=selected.min_length,
-        bannedMonths=selected.banned_months,
+        bannedMonths=list(selected.banned_months),
         description=_build_regulation_description(selected.min_length, selected.banned_months),
     )
     return FishAnalyzeResponse(species=selected.name, confidence=round(confidence, 2), regulation=regulation)
 
 
 @router.get("/species", response_model=list[FishSpeciesItem])
-def list_species(db: Session = Depends(get_db)):
-    rows = db.query(FishSpecies).order_by(FishSpecies.id.asc()).all()
+async def list_species(request: Request):
+    snapshot = await reference_data.get()
+    encoded = encode_once(snapshot.encoded, "species", snapshot.version, lambda: _species_items(snapshot.species))
+    return cached_json_response(request, encoded)
+
+
+def _species_items(rows) -> list[FishSpeciesItem]:
     return [
         FishSpeciesItem(
             name=row.name,
             minLength=row.min_length,
-            bannedMonths=row.banned_months,
+            bannedMonths=list(row.banned_months),
             category=row.category,
         )
         for row in rows
     ]
 
 
-@router.post("/check", response_model=FishCheckResponse)
-def check_fish(payload: FishCheckRequest, db: Session = Depends(get_db)):
-    species = db.query(FishSpecies).filter(FishSpecies.name == payload.species).first()
-    if not species:
-        raise not_found("해당 어종을 찾을 수 없습니다.", "SPECIES_NOT_FOUND")
-
-    current_month = datetime.utcnow().month
-    is_under_size = payload.length < species.min_length
-    is_banned_period = current_month in (species.banned_months or [])
+def _check_result(
+    species: SpeciesRecord,
+    rule: SpeciesRecord | RegulationRecord,
+    length: float,
+    month: int,
+    region_id: str | None,
+) -> dict:
+    """A ``FishCheckResponse`` as a plain dict: batches skip building thousands of models."""
+    is_under_size = length < rule.min_length
+    is_banned_period = rule.is_banned_in(month)
 
     if is_under_size:
-        message = f"최소 체장({species.min_length}cm) 미달입니다. 방류해주세요."
+        message = f"최소 체장({rule.min_length}cm) 미달입니다. 방류해주세요."
     elif is_banned_period:
         message = "현재 금어기입니다. 방류해주세요."
     else:
         message = "규정 위반이 아닙니다."
 
-    return FishCheckResponse(
-        species=species.name,
-        inputLength=payload.length,
-        minLength=species.min_length,
-        isUnderSize=is_under_size,
-        isBannedPeriod=is_banned_period,
-        message=message,
-    )
+    return {
+        "species": species.name,
+        "inputLength": length,
+        "minLength": rule.min_length,
+        "isUnderSize": is_under_size,
+        "isBannedPeriod": is_banned_period,
+        "message": message,
+        "regionId": region_id if rule is not species else None,
+    }
+
+
+@router.post("/check", response_model=FishCheckResponse)
+async def check_fish(payload: FishCheckRequest):
+    snapshot = await reference_data.get()
+    species = snapshot.species_by_name.get(payload.species)
+    if not species:
+        raise not_found("해당 어종을 찾을 수 없습니다.", "SPECIES_NOT_FOUND")
+    if payload.regionId is not None and payload.regionId not in snapshot.regions:
+        raise not_found("해당 지역 규제 정보를 찾을 수 없습니다.", "REGION_NOT_FOUND")
+    rule = snapshot.catch_rule(species, payload.regionId)
+    return _check_result(species, rule, payload.length, datetime.utcnow().month, payload.regionId)
+
+
+@router.post("/check/batch", response_model=FishCheckBatchResponse)
+async def check_fish_batch(payload: FishCheckBatchRequest):
+    if len(payload.items) > settings.fish_check_batch_max_items:
+        raise bad_request(
+            f"한 번에 최대 {settings.fish_check_batch_max_items}건까지 확인할 수 있습니다.", "TOO_MANY_ITEMS"
+        )
+
+    snapshot = await reference_data.get()
+    current_month = datetime.utcnow().month
+    # An unknown species or region fails only its own item, with the error /fish/check would return.
+    species_not_found = {
+        "result": None,
+        "error": {"message": "해당 어종을 찾을 수 없습니다.", "code": "SPECIES_NOT_FOUND"},
+    }
+    region_not_found = {
+        "result": None,
+        "error": {"message": "해당 지역 규제 정보를 찾을 수 없습니다.", "code": "REGION_NOT_FOUND"},
+    }
+    results = []
+    violations = 0
+    for item in payload.items:
+        species = snapshot.species_by_name.get(item.species)
+        if species is None:
+            results.append(species_not_found)
+            continue
+        if item.regionId is not None and item.regionId not in snapshot.regions:
+            results.append(region_not_found)
+            continue
+        month = item.caughtOn.month if item.caughtOn else current_month
+        result = _check_result(species, snapshot.catch_rule(species, item.regionId), item.length, month, item.regionId)
+        if result["isUnderSize"] or result["isBannedPeriod"]:
+            violations += 1
+        results.append({"result": result, "error": None})
+    # Every value comes from the reference snapshot or the validated request, so the body
+    # goes straight to orjson instead of through response_model validation.
+    return FastJSONResponse({"results": results, "violations": violations})
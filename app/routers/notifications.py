@@ -1,41 +1,120 @@
+import asyncio
+import json
+
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
 from app.core.deps import get_current_user
-from app.models import Notification, User
-from app.schemas.common import SuccessResponse
-from app.schemas.notification import NotificationOut, UnreadCountResponse
+from app.core.errors import forbidden, not_found
+from app.core.pagination import PageParams, keyset_page, page_params, split_page
+from app.core.principal_cache import Principal
+from app.core.responses import model_response
+from app.models import Notification
+from app.schemas.common import CursorPage, SuccessResponse
+from app.schemas.notification import BroadcastJobResponse, BroadcastRequest, NotificationOut, UnreadCountResponse
+from app.services.notification_fanout import BoundingBox, notification_fanout
+from app.services.notification_hub import notification_hub
+from app.services.notification_service import mark_all_read, unread_count
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
-def get_unread_count(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read.is_(False),
-    ).count()
-    return UnreadCountResponse(count=count)
-
-
-@router.get("", response_model=list[NotificationOut])
-def get_notifications(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    rows = (
-        db.query(Notification)
-        .filter(Notification.user_id == current_user.id)
-        .order_by(Notification.created_at.desc())
-        .limit(50)
-        .all()
-    )
-    return [NotificationOut.from_orm_row(r) for r in rows]
+async def get_unread_count(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
+    return UnreadCountResponse(count=await unread_count(db, current_user.id))
+
+
+@router.get("", response_model=CursorPage[NotificationOut])
+async def get_notifications(
+    page: PageParams = Depends(page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    query = select(Notification).where(Notification.user_id == current_user.id)
+    rows = (await db.scalars(keyset_page(query, Notification.created_at, Notification.id, page))).all()
+    rows, next_cursor = split_page(rows, page, lambda row: (row.created_at, row.id))
+    return model_response(CursorPage(items=[NotificationOut.from_orm_row(r) for r in rows], nextCursor=next_cursor))
 
 
 @router.put("/read-all", response_model=SuccessResponse)
-def read_all(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read.is_(False),
-    ).update({"is_read": True})
-    db.commit()
+async def read_all(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    await mark_all_read(db, current_user.id)
     return SuccessResponse(success=True)
+
+
+def _sse_frame(event: str, data: dict[str, object]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _notification_events(user_id: int, unread: int):
+    subscription = notification_hub.subscribe(user_id)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.notification_stream_max_seconds
+    try:
+        yield _sse_frame("unread", {"count": unread})
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                item = await asyncio.wait_for(
+                    subscription.queue.get(),
+                    timeout=min(settings.notification_stream_heartbeat_seconds, remaining),
+                )
+            except TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            if item is None:
+                # Fell too far behind; the client refetches the list and reconnects.
+                yield _sse_frame("resync", {})
+                return
+            yield _sse_frame(*item)
+    finally:
+        notification_hub.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_notifications(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    unread = await unread_count(db, current_user.id)
+    # The stream outlives this handler; hand the pooled connection back before it starts.
+    await db.close()
+    return StreamingResponse(
+        _notification_events(current_user.id, unread),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/broadcast", response_model=BroadcastJobResponse, status_code=202)
+async def start_broadcast(payload: BroadcastRequest, current_user: Principal = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise forbidden("관리자 권한이 필요합니다.", "ADMIN_REQUIRED")
+
+    region = None
+    if payload.region is not None:
+        region = BoundingBox(
+            min_lat=payload.region.minLat,
+            max_lat=payload.region.maxLat,
+            min_lng=payload.region.minLng,
+            max_lng=payload.region.maxLng,
+        )
+    job = notification_fanout.start(payload.type, payload.title, payload.message, region)
+    return BroadcastJobResponse.from_job(job)
+
+
+@router.get("/broadcast/{job_id}", response_model=BroadcastJobResponse)
+async def get_broadcast(job_id: int, current_user: Principal = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise forbidden("관리자 권한이 필요합니다.", "ADMIN_REQUIRED")
+
+    job = notification_fanout.get(job_id)
+    if job is None:
+        raise not_found("발송 작업을 찾을 수 없습니다.", "BROADCAST_NOT_FOUND")
+    return BroadcastJobResponse.from_job(job)
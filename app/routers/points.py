@@ -1,20 +1,30 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.deps import get_current_user
 from app.core.errors import not_found
-from app.models import Point, User
-from app.schemas.common import SuccessResponse
+from app.core.pagination import PageParams, keyset_page, page_params, split_page
+from app.core.principal_cache import Principal
+from app.core.responses import model_response
+from app.models import Point
+from app.schemas.common import CursorPage, SuccessResponse
 from app.schemas.point import PointCreateRequest, PointResponse
 
 router = APIRouter(prefix="/points", tags=["points"])
 
 
-@router.get("", response_model=list[PointResponse])
-def list_points(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    rows = db.query(Point).filter(Point.user_id == current_user.id).order_by(Point.created_at.desc()).all()
-    return [
+@router.get("", response_model=CursorPage[PointResponse])
+async def list_points(
+    page: PageParams = Depends(page_params),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    query = select(Point).where(Point.user_id == current_user.id)
+    rows = (await db.scalars(keyset_page(query, Point.created_at, Point.id, page))).all()
+    rows, next_cursor = split_page(rows, page, lambda row: (row.created_at, row.id))
+    items = [
         PointResponse(
             id=row.id,
             name=row.name,
@@ -26,13 +36,14 @@ def list_points(current_user: User = Depends(get_current_user), db: Session = De
         )
         for row in rows
     ]
+    return model_response(CursorPage(items=items, nextCursor=next_cursor))
 
 
 @router.post("", response_model=PointResponse, status_code=201)
-def create_point(
+async def create_point(
     payload: PointCreateRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     row = Point(
         user_id=current_user.id,
@@ -43,8 +54,8 @@ def create_point(
         color=payload.color,
     )
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.commit()
+    await db.refresh(row)
     return PointResponse(
         id=row.id,
         name=row.name,
@@ -57,15 +68,15 @@ def create_point(
 
 
 @router.delete("/{point_id}", response_model=SuccessResponse)
-def delete_point(
+async def delete_point(
     point_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
-    row = db.query(Point).filter(Point.id == point_id, Point.user_id == current_user.id).first()
+    row = await db.scalar(select(Point).where(Point.id == point_id, Point.user_id == current_user.id))
     if not row:
         raise not_found("포인트를 찾을 수 없습니다.", "POINT_NOT_FOUND")
 
-    db.delete(row)
-    db.commit()
+    await db.delete(row)
+    await db.commit()
     return SuccessResponse(success=True)
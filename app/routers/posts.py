@@ -3,14 +3,26 @@ import uuid
 
 from fastapi import APIRouter, Depends, File, Form, UploadFile
 from pydantic import BaseModel
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.deps import get_current_user
 from app.core.errors import bad_request, forbidden, not_found
+from app.core.pagination import (
+    PageParams,
+    decode_offset_cursor,
+    encode_offset_cursor,
+    keyset_page,
+    page_params,
+    split_page,
+)
+from app.core.principal_cache import Principal
+from app.core.responses import model_response
 from app.models import Comment, Post, User
-from app.schemas.common import SuccessResponse
+from app.schemas.common import CursorPage, SuccessResponse
+from app.services.notification_service import create_notification
+from app.services.post_search import post_search_index
 from app.schemas.post import (
     CommentCreateRequest,
     CommentItem,
@@ -21,41 +33,44 @@ from app.schemas.post import (
 
 UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
 
-@router.get("", response_model=list[PostListItem])
-def list_posts(search: str | None = None, db: Session = Depends(get_db)):
-    comment_count_subquery = (
-        db.query(Comment.post_id, func.count(Comment.id).label("comment_count"))
-        .group_by(Comment.post_id)
-        .subquery()
-    )
-
-    query = (
-        db.query(Post, User.nickname, func.coalesce(comment_count_subquery.c.comment_count, 0))
-        .join(User, Post.user_id == User.id)
-        .outerjoin(comment_count_subquery, Post.id == comment_count_subquery.c.post_id)
-        .order_by(Post.created_at.desc())
-    )
-    if search:
-        like = f"%{search}%"
-        query = query.filter(or_(Post.title.like(like), Post.content.like(like)))
-
-    rows = query.all()
-    return [
+@router.get("", response_model=CursorPage[PostListItem])
+async def list_posts(
+    search: str | None = None,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    search = search.strip() if search else None
+    if search and post_search_index.can_search(search):
+        # Relevance order has no stable seek key, so ranked results page by offset.
+        offset = decode_offset_cursor(page.cursor)
+        rows = (await db.execute(post_search_index.search_query(search, offset, page.limit + 1))).all()
+        next_cursor = encode_offset_cursor(offset + page.limit) if len(rows) > page.limit else None
+        rows = rows[: page.limit]
+    else:
+        query = select(Post, User.nickname).join(User, Post.user_id == User.id)
+        if search:
+            like = f"%{search}%"
+            query = query.where(or_(Post.title.like(like), Post.content.like(like)))
+        rows = (await db.execute(keyset_page(query, Post.created_at, Post.id, page))).all()
+        rows, next_cursor = split_page(rows, page, lambda row: (row[0].created_at, row[0].id))
+    items = [
         PostListItem(
             id=post.id,
             title=post.title,
             content=post.content,
             author=nickname,
             date=post.created_at.strftime("%Y-%m-%d"),
-            comments=comment_count,
+            comments=post.comment_count,
             image=post.image,
         )
-        for post, nickname, comment_count in rows
+        for post, nickname in rows
     ]
+    return model_response(CursorPage(items=items, nextCursor=next_cursor))
 
 
 @router.post("", response_model=PostListItem, status_code=201)
@@ -63,8 +78,8 @@ async def create_post(
     title: str = Form(...),
     content: str = Form(...),
     image: UploadFile | None = File(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     if not title.strip() or not content.strip():
         raise bad_request("제목과 내용을 입력해주세요.", "EMPTY_FIELDS")
@@ -76,15 +91,15 @@ async def create_post(
             raise bad_request("지원하지 않는 이미지 형식입니다.", "INVALID_IMAGE_TYPE")
         filename = f"{uuid.uuid4().hex}{ext}"
         filepath = os.path.join(UPLOAD_DIR, filename)
-        data = await image.read()
         with open(filepath, "wb") as f:
-            f.write(data)
+            while chunk := await image.read(UPLOAD_CHUNK_SIZE):
+                f.write(chunk)
         image_path = f"/uploads/{filename}"
 
     row = Post(user_id=current_user.id, title=title.strip(), content=content.strip(), image=image_path)
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.commit()
+    await db.refresh(row)
 
     return PostListItem(
         id=row.id,
@@ -98,23 +113,27 @@ async def create_post(
 
 
 @router.get("/{post_id}", response_model=PostDetailResponse)
-def get_post(post_id: int, db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+async def get_post(post_id: int, db: AsyncSession = Depends(get_read_db)):
+    row = (
+        await db.execute(select(Post, User.nickname).join(User, Post.user_id == User.id).where(Post.id == post_id))
+    ).first()
+    if not row:
         raise not_found("게시글을 찾을 수 없습니다.", "POST_NOT_FOUND")
+    post, author = row
 
     comments = (
-        db.query(Comment, User.nickname)
-        .join(User, Comment.user_id == User.id)
-        .filter(Comment.post_id == post.id)
-        .order_by(Comment.created_at.asc())
-        .all()
-    )
+        await db.execute(
+            select(Comment, User.nickname)
+            .join(User, Comment.user_id == User.id)
+            .where(Comment.post_id == post.id)
+            .order_by(Comment.created_at.asc())
+        )
+    ).all()
     return PostDetailResponse(
         id=post.id,
         title=post.title,
         content=post.content,
-        author=post.user.nickname,
+        author=author,
         date=post.created_at.strftime("%Y-%m-%d"),
         comments=[
             CommentItem(
@@ -129,19 +148,19 @@ def get_post(post_id: int, db: Session = Depends(get_db)):
 
 
 @router.delete("/{post_id}", response_model=SuccessResponse)
-def delete_post(
+async def delete_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise not_found("게시글을 찾을 수 없습니다.", "POST_NOT_FOUND")
     if post.user_id != current_user.id and current_user.role != "admin":
         raise forbidden("본인 게시글만 삭제할 수 있습니다.", "POST_DELETE_FORBIDDEN")
 
-    db.delete(post)
-    db.commit()
+    await db.delete(post)
+    await db.commit()
     return SuccessResponse(success=True)
 
 
@@ -150,46 +169,45 @@ class AdminDeleteRequest(BaseModel):
 
 
 @router.put("/{post_id}/admin-delete", response_model=SuccessResponse)
-def admin_delete_post(
+async def admin_delete_post(
     post_id: int,
     payload: AdminDeleteRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     if current_user.role != "admin":
         raise forbidden("관리자 권한이 필요합니다.", "ADMIN_REQUIRED")
 
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise not_found("게시글을 찾을 수 없습니다.", "POST_NOT_FOUND")
 
-    from app.models import Notification
-    notification = Notification(
+    await create_notification(
+        db,
         user_id=post.user_id,
         type="post_deleted",
         title="게시글이 삭제되었습니다",
         message=f"'{post.title}' 게시글이 관리자에 의해 삭제되었습니다. 사유: {payload.reason or '규정 위반'}",
     )
-    db.add(notification)
-    db.delete(post)
-    db.commit()
+    await db.delete(post)
+    await db.commit()
     return SuccessResponse(success=True)
 
 
-@router.get("/{post_id}/comments", response_model=list[CommentItem])
-def list_comments(post_id: int, db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.id == post_id).first()
+@router.get("/{post_id}/comments", response_model=CursorPage[CommentItem])
+async def list_comments(
+    post_id: int,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    post = await db.get(Post, post_id)
     if not post:
         raise not_found("게시글을 찾을 수 없습니다.", "POST_NOT_FOUND")
 
-    rows = (
-        db.query(Comment, User.nickname)
-        .join(User, Comment.user_id == User.id)
-        .filter(Comment.post_id == post_id)
-        .order_by(Comment.created_at.asc())
-        .all()
-    )
-    return [
+    query = select(Comment, User.nickname).join(User, Comment.user_id == User.id).where(Comment.post_id == post_id)
+    rows = (await db.execute(keyset_page(query, Comment.created_at, Comment.id, page, descending=False))).all()
+    rows, next_cursor = split_page(rows, page, lambda row: (row[0].created_at, row[0].id))
+    items = [
         CommentItem(
             id=comment.id,
             text=comment.text,
@@ -198,26 +216,53 @@ def list_comments(post_id: int, db: Session = Depends(get_db)):
         )
         for comment, nickname in rows
     ]
+    return model_response(CursorPage(items=items, nextCursor=next_cursor))
 
 
 @router.post("/{post_id}/comments", response_model=CommentItem, status_code=201)
-def create_comment(
+async def create_comment(
     post_id: int,
     payload: CommentCreateRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+    # Bumping the counter doubles as the existence check, and both writes land in
+    # the same transaction so the feed count never drifts from the comments table.
+    result = await db.execute(
+        update(Post).where(Post.id == post_id).values(comment_count=Post.comment_count + 1)
+    )
+    if result.rowcount == 0:
         raise not_found("게시글을 찾을 수 없습니다.", "POST_NOT_FOUND")
 
     row = Comment(post_id=post_id, user_id=current_user.id, text=payload.text)
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.commit()
+    await db.refresh(row)
     return CommentItem(
         id=row.id,
         text=row.text,
         author=current_user.nickname,
         date=row.created_at.strftime("%Y-%m-%d"),
     )
+
+
+@router.delete("/{post_id}/comments/{comment_id}", response_model=SuccessResponse)
+async def delete_comment(
+    post_id: int,
+    comment_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    comment = await db.scalar(select(Comment).where(Comment.id == comment_id, Comment.post_id == post_id))
+    if not comment:
+        raise not_found("댓글을 찾을 수 없습니다.", "COMMENT_NOT_FOUND")
+    if comment.user_id != current_user.id and current_user.role != "admin":
+        raise forbidden("본인 댓글만 삭제할 수 있습니다.", "COMMENT_DELETE_FORBIDDEN")
+
+    result = await db.execute(delete(Comment).where(Comment.id == comment_id))
+    if result.rowcount:
+        await db.execute(
+            update(Post).where(Post.id == post_id).values(comment_count=Post.comment_count - result.rowcount)
+        )
+    await db.commit()
+    return SuccessResponse(success=True)
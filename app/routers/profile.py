@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.errors import unauthorized
+from app.core.principal_cache import Principal, principal_cache
 from app.models import User
 from app.schemas.profile import UpdateNicknameRequest
 from app.schemas.user import UserPublic
@@ -11,18 +13,23 @@ router = APIRouter(prefix="/profile", tags=["profile"])
 
 
 @router.get("", response_model=UserPublic)
-def get_profile(current_user: User = Depends(get_current_user)):
+async def get_profile(current_user: Principal = Depends(get_current_user)):
     return UserPublic.model_validate(current_user)
 
 
 @router.put("/nickname", response_model=UserPublic)
-def update_nickname(
+async def update_nickname(
     payload: UpdateNicknameRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
-    current_user.nickname = payload.nickname
-    db.add(current_user)
-    db.commit()
-    db.refresh(current_user)
-    return UserPublic.model_validate(current_user)
+    user = await db.get(User, current_user.id)
+    if not user:
+        raise unauthorized("사용자를 찾을 수 없습니다.", "USER_NOT_FOUND")
+
+    user.nickname = payload.nickname
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    principal_cache.invalidate_user(user.id)
+    return UserPublic.model_validate(user)
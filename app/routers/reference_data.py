@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+
+from app.core.deps import get_current_user
+from app.core.errors import forbidden
+from app.core.principal_cache import Principal
+from app.schemas.reference_data import ReferenceDataVersionResponse
+from app.services.reference_data import reference_data
+
+router = APIRouter(prefix="/reference-data", tags=["reference-data"])
+
+
+@router.get("/version", response_model=ReferenceDataVersionResponse)
+async def get_reference_data_version():
+    return ReferenceDataVersionResponse.from_snapshot(await reference_data.get())
+
+
+@router.post("/reload", response_model=ReferenceDataVersionResponse)
+async def reload_reference_data(current_user: Principal = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise forbidden("관리자 권한이 필요합니다.", "ADMIN_REQUIRED")
+    return ReferenceDataVersionResponse.from_snapshot(await reference_data.reload())
@@ -1,50 +1,46 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Request
 
-from app.core.database import get_db
 from app.core.errors import not_found
-from app.models import Regulation
+from app.core.http_cache import cached_json_response, encode_once
 from app.schemas.regulation import RegulationRegionResponse, RegulationSpeciesItem
+from app.services.reference_data import RegionRegulations, reference_data
 
 router = APIRouter(prefix="/regulations", tags=["regulations"])
 
 
-@router.get("", response_model=list[RegulationRegionResponse])
-def list_regulations(db: Session = Depends(get_db)):
-    rows = db.query(Regulation).order_by(Regulation.region_id.asc(), Regulation.id.asc()).all()
-    grouped: dict[str, RegulationRegionResponse] = {}
-
-    for row in rows:
-        if row.region_id not in grouped:
-            grouped[row.region_id] = RegulationRegionResponse(id=row.region_id, region=row.region, species=[])
-        grouped[row.region_id].species.append(
+def _region_response(region: RegionRegulations) -> RegulationRegionResponse:
+    return RegulationRegionResponse(
+        id=region.region_id,
+        region=region.region,
+        species=[
             RegulationSpeciesItem(
-                name=row.species.name,
+                name=row.species_name,
                 minLength=row.min_length,
                 bannedPeriod=row.banned_period,
                 fine=row.fine,
             )
-        )
+            for row in region.regulations
+        ],
+    )
 
-    return list(grouped.values())
+
+@router.get("", response_model=list[RegulationRegionResponse])
+async def list_regulations(request: Request):
+    snapshot = await reference_data.get()
+    encoded = encode_once(
+        snapshot.encoded,
+        "regulations",
+        snapshot.version,
+        lambda: [_region_response(region) for region in snapshot.regions.values()],
+    )
+    return cached_json_response(request, encoded)
 
 
 @router.get("/{region_id}", response_model=RegulationRegionResponse)
-def get_regulations_by_region(region_id: str, db: Session = Depends(get_db)):
-    rows = db.query(Regulation).filter(Regulation.region_id == region_id).order_by(Regulation.id.asc()).all()
-    if not rows:
+async def get_regulations_by_region(region_id: str, request: Request):
+    snapshot = await reference_data.get()
+    region = snapshot.regions.get(region_id)
+    if region is None:
         raise not_found("해당 지역 규제 정보를 찾을 수 없습니다.", "REGION_NOT_FOUND")
-
-    return RegulationRegionResponse(
-        id=rows[0].region_id,
-        region=rows[0].region,
-        species=[
-            RegulationSpeciesItem(
-                name=row.species.name,
-                minLength=row.min_length,
-                bannedPeriod=row.banned_period,
-                fine=row.fine,
-            )
-            for row in rows
-        ],
-    )
+    encoded = encode_once(snapshot.encoded, f"regulations/{region_id}", snapshot.version, lambda: _region_response(region))
+    return cached_json_response(request, encoded)
@@ -1,26 +1,33 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.deps import get_current_user
+from app.core.pagination import PageParams, keyset_page, page_params, split_page
+from app.core.principal_cache import Principal
+from app.core.responses import model_response
 from app.models import Report, User
+from app.schemas.common import CursorPage
 from app.schemas.report import ReportCreateRequest, ReportCreateResponse, ReportListItem
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
-@router.get("", response_model=list[ReportListItem])
-def list_reports(
+@router.get("", response_model=CursorPage[ReportListItem])
+async def list_reports(
     status: str | None = None,
-    _: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    page: PageParams = Depends(page_params),
+    _: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    query = db.query(Report, User.nickname).join(User, Report.user_id == User.id)
+    query = select(Report, User.nickname).join(User, Report.user_id == User.id)
     if status:
-        query = query.filter(Report.status == status)
-    rows = query.order_by(Report.created_at.desc()).all()
+        query = query.where(Report.status == status)
+    rows = (await db.execute(keyset_page(query, Report.created_at, Report.id, page))).all()
+    rows, next_cursor = split_page(rows, page, lambda row: (row[0].created_at, row[0].id))
 
-    return [
+    items = [
         ReportListItem(
             id=report.id,
             type=report.type,
@@ -33,13 +40,14 @@ def list_reports(
         )
         for report, nickname in rows
     ]
+    return model_response(CursorPage(items=items, nextCursor=next_cursor))
 
 
 @router.post("", response_model=ReportCreateResponse, status_code=201)
-def create_report(
+async def create_report(
     payload: ReportCreateRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     row = Report(
         user_id=current_user.id,
@@ -50,8 +58,8 @@ def create_report(
         status="pending",
     )
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.commit()
+    await db.refresh(row)
 
     return ReportCreateResponse(
         id=row.id,
@@ -1,22 +1,26 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Request
 
-from app.core.database import get_db
-from app.models import Zone
+from app.core.http_cache import cached_json_response, encode_once
 from app.schemas.zone import ZoneResponse
+from app.services.reference_data import reference_data
 
 router = APIRouter(prefix="/zones", tags=["zones"])
 
 
 @router.get("", response_model=list[ZoneResponse])
-def list_zones(db: Session = Depends(get_db)):
-    rows = db.query(Zone).order_by(Zone.id.asc()).all()
+async def list_zones(request: Request):
+    snapshot = await reference_data.get()
+    encoded = encode_once(snapshot.encoded, "zones", snapshot.version, lambda: _zone_items(snapshot.zones))
+    return cached_json_response(request, encoded)
+
+
+def _zone_items(rows) -> list[ZoneResponse]:
     return [
         ZoneResponse(
             id=row.id,
             name=row.name,
             type=row.type,
-            coordinates=row.coordinates,
+            coordinates=[list(point) for point in row.coordinates],
             description=row.description,
             period=row.period,
         )
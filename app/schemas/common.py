@@ -1,6 +1,11 @@
+from typing import Generic, TypeVar
+
 from pydantic import BaseModel
 
 
+ItemT = TypeVar("ItemT")
+
+
 class ErrorResponse(BaseModel):
     message: str
     code: str
@@ -8,3 +13,8 @@ class ErrorResponse(BaseModel):
 
 class SuccessResponse(BaseModel):
     success: bool
+
+
+class CursorPage(BaseModel, Generic[ItemT]):
+    items: list[ItemT]
+    nextCursor: str | None = None
@@ -1,5 +1,9 @@
+from datetime import date
+
 from pydantic import BaseModel, Field
 
+from app.schemas.common import ErrorResponse
+
 
 class FishAnalyzeRequest(BaseModel):
     image: str
@@ -28,6 +32,7 @@ class FishSpeciesItem(BaseModel):
 class FishCheckRequest(BaseModel):
     species: str
     length: float = Field(gt=0)
+    regionId: str | None = None
 
 
 class FishCheckResponse(BaseModel):
@@ -37,3 +42,26 @@ class FishCheckResponse(BaseModel):
     isUnderSize: bool
     isBannedPeriod: bool
     message: str
+    # The region whose rule was applied; null when the national rule was.
+    regionId: str | None = None
+
+
+class FishCheckBatchItem(BaseModel):
+    species: str
+    length: float = Field(gt=0)
+    caughtOn: date | None = None
+    regionId: str | None = None
+
+
+class FishCheckBatchRequest(BaseModel):
+    items: list[FishCheckBatchItem] = Field(min_length=1)
+
+
+class FishCheckBatchResult(BaseModel):
+    result: FishCheckResponse | None = None
+    error: ErrorResponse | None = None
+
+
+class FishCheckBatchResponse(BaseModel):
+    results: list[FishCheckBatchResult]
+    violations: int
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NotificationOut(BaseModel):
@@ -27,3 +27,41 @@ class NotificationOut(BaseModel):
 
 class UnreadCountResponse(BaseModel):
     count: int
+
+
+class BroadcastRegion(BaseModel):
+    minLat: float
+    maxLat: float
+    minLng: float
+    maxLng: float
+
+
+class BroadcastRequest(BaseModel):
+    type: str = Field(default="announcement", min_length=1, max_length=50)
+    title: str = Field(min_length=1, max_length=200)
+    message: str = Field(min_length=1)
+    region: BroadcastRegion | None = None
+
+
+class BroadcastJobResponse(BaseModel):
+    id: int
+    status: str
+    total: int
+    sent: int
+    createdAt: datetime | None = None
+    startedAt: datetime | None = None
+    finishedAt: datetime | None = None
+    error: str | None = None
+
+    @classmethod
+    def from_job(cls, job):
+        return cls(
+            id=job.id,
+            status=job.status,
+            total=job.total,
+            sent=job.sent,
+            createdAt=job.created_at,
+            startedAt=job.started_at,
+            finishedAt=job.finished_at,
+            error=job.error,
+        )
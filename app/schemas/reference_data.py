@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ReferenceDataVersionResponse(BaseModel):
+    version: int
+    loadedAt: datetime
+    species: int
+    regions: int
+    fines: int
+    zones: int
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        return cls(
+            version=snapshot.version,
+            loadedAt=snapshot.loaded_at,
+            species=len(snapshot.species),
+            regions=len(snapshot.regions),
+            fines=len(snapshot.fines),
+            zones=len(snapshot.zones),
+        )
@@ -0,0 +1,41 @@
+import logging
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Comment, Post
+
+
+logger = logging.getLogger(__name__)
+
+
+def recount_comment_counts(db: Session, batch_size: int = 1000) -> int:
+    """Recompute ``Post.comment_count`` from the comments table; return how many posts changed.
+
+    Posts are walked in id ranges with one UPDATE per range, so the writer lock is
+    only held for a batch at a time and live comment traffic keeps flowing.
+    """
+    actual = select(func.count()).where(Comment.post_id == Post.id).correlate(Post).scalar_subquery()
+    last_id = db.scalar(select(func.max(Post.id))) or 0
+    changed = 0
+    for start in range(0, last_id, batch_size):
+        result = db.execute(
+            update(Post)
+            .where(Post.id > start, Post.id <= start + batch_size, Post.comment_count != actual)
+            .values(comment_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        changed += result.rowcount
+    return changed
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    session = SessionLocal()
+    try:
+        logger.info("Repaired comment counts on %d posts", recount_comment_counts(session))
+    finally:
+        session.close()
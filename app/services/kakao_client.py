@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+import httpx
+
+from app.core.config import settings
+
+
+class KakaoAuthError(Exception):
+    pass
+
+
+class KakaoClient:
+    """Pooled client for the Kakao user API with request coalescing and a short TTL cache."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: httpx.Timeout,
+        limits: httpx.Limits,
+        cache_ttl_seconds: float,
+        cache_max_entries: int,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.limits = limits
+        self.transport = transport
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        self.client: httpx.AsyncClient | None = None
+        self.cache: OrderedDict[str, tuple[dict[str, object], float]] = OrderedDict()
+        self.in_flight: dict[str, asyncio.Task] = {}
+        self.upstream_calls = 0
+
+    async def start(self) -> None:
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                transport=self.transport,
+            )
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+        self.cache.clear()
+
+    async def fetch_user(self, access_token: str) -> dict[str, object]:
+        key = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache(key, access_token))
+            self.in_flight[key] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(self, key: str, access_token: str) -> dict[str, object]:
+        await self.start()
+        self.upstream_calls += 1
+        response = await self.client.get("/v2/user/me", headers={"Authorization": f"Bearer {access_token}"})
+        if response.status_code != 200:
+            raise KakaoAuthError(response.status_code)
+
+        user = response.json()
+        self._cache_put(key, user)
+        return user
+
+    def _cache_get(self, key: str) -> dict[str, object] | None:
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            self.cache.pop(key, None)
+            return None
+        return user
+
+    def _cache_put(self, key: str, user: dict[str, object]) -> None:
+        if self.cache_max_entries <= 0 or self.cache_ttl_seconds <= 0:
+            return
+        self.cache[key] = (user, time.monotonic() + self.cache_ttl_seconds)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_max_entries:
+            self.cache.popitem(last=False)
+
+
+kakao_client = KakaoClient(
+    base_url=settings.kakao_api_base_url,
+    timeout=httpx.Timeout(settings.kakao_http_timeout_seconds, connect=settings.kakao_http_connect_timeout_seconds),
+    limits=httpx.Limits(
+        max_connections=settings.kakao_http_max_connections,
+        max_keepalive_connections=settings.kakao_http_max_keepalive_connections,
+    ),
+    cache_ttl_seconds=settings.kakao_profile_cache_ttl_seconds,
+    cache_max_entries=settings.kakao_profile_cache_max_entries,
+)
@@ -0,0 +1,172 @@
+import asyncio
+import itertools
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.sql_stats import current_sql_stats
+from app.models import Notification, Point, User
+from app.schemas.notification import NotificationOut
+from app.services.notification_hub import notification_hub
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    min_lat: float
+    max_lat: float
+    min_lng: float
+    max_lng: float
+
+
+@dataclass(slots=True)
+class FanoutJob:
+    id: int
+    type: str
+    title: str
+    message: str
+    region: BoundingBox | None
+    status: str = "pending"
+    total: int = 0
+    sent: int = 0
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+
+
+class NotificationFanout:
+    """Background bulk sender for announcements to every user or every user with points in a region.
+
+    Recipients are streamed by ascending user id, ``chunk_size`` at a time. Each chunk is
+    one short writer transaction: a single executemany insert of the notifications and
+    one counter UPDATE, so request-path writes interleave between chunks instead of
+    waiting for the whole job.
+    """
+
+    def __init__(self, chunk_size: int, max_jobs: int = 100):
+        self.chunk_size = chunk_size
+        self.max_jobs = max_jobs
+        self.jobs: OrderedDict[int, FanoutJob] = OrderedDict()
+        self.tasks: dict[int, asyncio.Task] = {}
+        self.ids = itertools.count(1)
+
+    def start(self, type: str, title: str, message: str, region: BoundingBox | None = None) -> FanoutJob:
+        job = FanoutJob(
+            id=next(self.ids),
+            type=type,
+            title=title,
+            message=message,
+            region=region,
+            created_at=datetime.utcnow(),
+        )
+        self.jobs[job.id] = job
+        while len(self.jobs) > self.max_jobs:
+            oldest_id, oldest = next(iter(self.jobs.items()))
+            if oldest.status in ("pending", "running"):
+                break
+            del self.jobs[oldest_id]
+        task = asyncio.create_task(self.run(job), name=f"notification-fanout-{job.id}")
+        self.tasks[job.id] = task
+        task.add_done_callback(lambda _: self.tasks.pop(job.id, None))
+        return job
+
+    def get(self, job_id: int) -> FanoutJob | None:
+        return self.jobs.get(job_id)
+
+    async def stop(self) -> None:
+        tasks = list(self.tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, job: FanoutJob) -> FanoutJob:
+        # The task inherited the starting request's context; keep its statements out of that request's stats.
+        current_sql_stats.set(None)
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        try:
+            async with AsyncSessionLocal() as db:
+                job.total = await db.scalar(select(func.count()).select_from(self._recipients(job).subquery()))
+                await db.commit()
+                user_id_column = User.id if job.region is None else Point.user_id
+                last_user_id = 0
+                while True:
+                    user_ids = (
+                        await db.scalars(
+                            self._recipients(job)
+                            .where(user_id_column > last_user_id)
+                            .order_by(user_id_column)
+                            .limit(self.chunk_size)
+                        )
+                    ).all()
+                    if not user_ids:
+                        break
+                    await self._send_chunk(db, job, user_ids)
+                    last_user_id = user_ids[-1]
+                    job.sent += len(user_ids)
+                    # Hand the event loop (and the writer connection) back between chunks.
+                    await asyncio.sleep(0)
+            job.status = "done"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as exc:
+            logger.exception("Notification fan-out %d failed: %s", job.id, exc)
+            job.status = "failed"
+            job.error = str(exc)
+        finally:
+            job.finished_at = datetime.utcnow()
+        return job
+
+    def _recipients(self, job: FanoutJob):
+        if job.region is None:
+            return select(User.id)
+        box = job.region
+        return (
+            select(Point.user_id)
+            .where(Point.lat.between(box.min_lat, box.max_lat), Point.lng.between(box.min_lng, box.max_lng))
+            .group_by(Point.user_id)
+        )
+
+    async def _send_chunk(self, db: AsyncSession, job: FanoutJob, user_ids: list[int]) -> None:
+        live_user_ids = {user_id for user_id in user_ids if user_id in notification_hub.subscribers}
+        statement = insert(Notification)
+        if live_user_ids:
+            # Only chunks with a connected recipient pay for RETURNING the inserted rows.
+            statement = statement.returning(
+                Notification.id,
+                Notification.user_id,
+                Notification.type,
+                Notification.title,
+                Notification.message,
+                Notification.is_read,
+                Notification.created_at,
+            )
+        result = await db.execute(
+            statement,
+            [
+                {"user_id": user_id, "type": job.type, "title": job.title, "message": job.message}
+                for user_id in user_ids
+            ],
+        )
+        live_rows = [row for row in result.all() if row.user_id in live_user_ids] if live_user_ids else []
+        await db.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(unread_notification_count=User.unread_notification_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        for row in live_rows:
+            notification_hub.publish(row.user_id, "notification", NotificationOut.from_orm_row(row).model_dump(mode="json"))
+
+notification_fanout = NotificationFanout(chunk_size=settings.notification_fanout_chunk_size)
@@ -0,0 +1,67 @@
+import asyncio
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+
+@dataclass(eq=False, slots=True)
+class Subscription:
+    user_id: int
+    queue: asyncio.Queue
+    overflowed: bool = False
+
+
+class NotificationHub:
+    """In-process fan-out of notification events to streaming subscribers.
+
+    Every subscriber owns a bounded queue. ``publish`` never waits: when a
+    subscriber's queue is full its backlog is dropped and replaced by a single
+    ``None`` marker, which ends the stream so the client reconnects and catches up
+    from ``/notifications`` instead of the hub buffering without limit or silently
+    losing events. Only subscribers connected to this worker process are reached.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.subscribers: dict[int, set[Subscription]] = {}
+        self.published = 0
+        self.overflows = 0
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(user_id=user_id, queue=asyncio.Queue(maxsize=self.queue_size))
+        self.subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        user_subscriptions = self.subscribers.get(subscription.user_id)
+        if user_subscriptions is None:
+            return
+        user_subscriptions.discard(subscription)
+        if not user_subscriptions:
+            del self.subscribers[subscription.user_id]
+
+    def publish(self, user_id: int, event: str, data: dict[str, object]) -> int:
+        """Queue ``event`` for every stream of ``user_id``; return how many received it."""
+        delivered = 0
+        for subscription in list(self.subscribers.get(user_id, ())):
+            try:
+                subscription.queue.put_nowait((event, data))
+                delivered += 1
+            except asyncio.QueueFull:
+                self._overflow(subscription)
+        self.published += delivered
+        return delivered
+
+    def connection_count(self) -> int:
+        return sum(len(user_subscriptions) for user_subscriptions in self.subscribers.values())
+
+    def _overflow(self, subscription: Subscription) -> None:
+        subscription.overflowed = True
+        self.overflows += 1
+        self.unsubscribe(subscription)
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+
+notification_hub = NotificationHub(queue_size=settings.notification_stream_queue_size)
@@ -0,0 +1,93 @@
+import logging
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import Notification, User
+from app.schemas.notification import NotificationOut
+from app.services.notification_hub import notification_hub
+
+
+logger = logging.getLogger(__name__)
+
+PENDING_PUSH_KEY = "pending_notification_push"
+
+
+async def create_notification(db: AsyncSession, user_id: int, type: str, title: str, message: str) -> Notification:
+    """Queue a notification and bump the recipient's unread counter in the caller's transaction."""
+    notification = Notification(user_id=user_id, type=type, title=title, message=message)
+    db.add(notification)
+    db.sync_session.info.setdefault(PENDING_PUSH_KEY, []).append(notification)
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(unread_notification_count=User.unread_notification_count + 1)
+    )
+    return notification
+
+
+async def mark_all_read(db: AsyncSession, user_id: int) -> int:
+    # Subtract exactly the rows this statement flipped: a notification committed
+    # between the two statements stays unread and keeps its increment.
+    result = await db.execute(
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.is_read.is_(False))
+        .values(is_read=True)
+    )
+    if result.rowcount:
+        await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(unread_notification_count=User.unread_notification_count - result.rowcount)
+        )
+    await db.commit()
+    notification_hub.publish(user_id, "read_all", {})
+    return result.rowcount
+
+
+async def unread_count(db: AsyncSession, user_id: int) -> int:
+    return await db.scalar(select(User.unread_notification_count).where(User.id == user_id)) or 0
+
+
+@event.listens_for(Session, "after_commit")
+def _push_committed_notifications(session: Session) -> None:
+    # Streams only hear about notifications once they are durable; a rolled-back
+    # producer never reaches a client.
+    for notification in session.info.pop(PENDING_PUSH_KEY, ()):
+        payload = NotificationOut.from_orm_row(notification).model_dump(mode="json")
+        notification_hub.publish(notification.user_id, "notification", payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_notifications(session: Session) -> None:
+    session.info.pop(PENDING_PUSH_KEY, None)
+
+
+def recount_unread_counts(db: Session) -> int:
+    """Recompute every user's unread counter from the notifications table; return how many changed."""
+    actual = (
+        select(func.count())
+        .where(Notification.user_id == User.id, Notification.is_read.is_(False))
+        .correlate(User)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(User)
+        .where(User.unread_notification_count != actual)
+        .values(unread_notification_count=actual)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    session = SessionLocal()
+    try:
+        logger.info("Repaired unread notification counts on %d users", recount_unread_counts(session))
+    finally:
+        session.close()
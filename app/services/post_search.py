@@ -0,0 +1,87 @@
+import logging
+
+from sqlalchemy import Engine, column, func, literal_column, select, table, text
+from sqlalchemy.exc import OperationalError
+
+from app.models import Post, User
+
+
+logger = logging.getLogger(__name__)
+
+# The trigram tokenizer indexes every 3-character window, so it matches Korean
+# substrings (no word segmentation needed) and keeps the substring semantics of
+# the old LIKE search. Queries shorter than a trigram cannot use the index.
+MIN_QUERY_LENGTH = 3
+
+posts_fts = table("posts_fts", column("rowid"), column("posts_fts"))
+
+_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, content, content='posts', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO posts_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+)
+
+
+class PostSearchIndex:
+    """FTS5 index over post titles and bodies, kept in sync with ``posts`` by triggers."""
+
+    def __init__(self, title_weight: float = 10.0, content_weight: float = 1.0):
+        self.title_weight = title_weight
+        self.content_weight = content_weight
+        self.available = False
+
+    def install(self, engine: Engine) -> None:
+        if engine.dialect.name != "sqlite":
+            return
+        try:
+            with engine.begin() as connection:
+                exists = connection.scalar(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'")
+                )
+                for statement in _SCHEMA:
+                    connection.execute(text(statement))
+                if not exists:
+                    connection.execute(text("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')"))
+        except OperationalError as exc:
+            logger.warning("Post full-text search unavailable, falling back to LIKE: %s", exc)
+            self.available = False
+            return
+        self.available = True
+
+    def can_search(self, query: str) -> bool:
+        return self.available and len(query) >= MIN_QUERY_LENGTH
+
+    def search_query(self, query: str, offset: int, limit: int):
+        """Posts matching ``query`` as a substring of title or content, best BM25 match first."""
+        phrase = '"' + query.replace('"', '""') + '"'
+        rank = func.bm25(literal_column("posts_fts"), self.title_weight, self.content_weight)
+        return (
+            select(Post, User.nickname)
+            .join(posts_fts, posts_fts.c.rowid == Post.id)
+            .join(User, Post.user_id == User.id)
+            .where(posts_fts.c.posts_fts.op("MATCH")(phrase))
+            .order_by(rank, Post.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+
+
+post_search_index = PostSearchIndex()
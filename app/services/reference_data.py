@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+
+from sqlalchemy import select
+
+from app.core.database import ReadSessionLocal
+from app.core.http_cache import EncodedBody
+from app.models import Fine, FishSpecies, Regulation, Zone
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SpeciesRecord:
+    id: int
+    name: str
+    min_length: int
+    banned_months: tuple[int, ...]
+    # Bit (month - 1) is set for every banned month, so a check is one shift and mask.
+    banned_month_mask: int
+    category: str
+    fine: str | None
+
+    def is_banned_in(self, month: int) -> bool:
+        return bool(self.banned_month_mask >> (month - 1) & 1)
+
+
+NO_BANNED_PERIOD = {"", "없음", "-"}
+# "5월", "5월~6월", "5~6월", "12월~2월", "5월 1일~6월 30일"; day precision is dropped to whole months.
+BANNED_PERIOD_SEGMENT = re.compile(r"^(\d{1,2})(월(?:\s*\d{1,2}일)?)?(?:\s*[~\-]\s*(\d{1,2})월(?:\s*\d{1,2}일)?)?$")
+
+
+def month_mask(months) -> int:
+    mask = 0
+    for month in months:
+        if 1 <= month <= 12:
+            mask |= 1 << (month - 1)
+    return mask
+
+
+def month_range_mask(start: int, end: int) -> int:
+    """Months ``start`` through ``end`` inclusive; a range like 12월~2월 wraps past December."""
+    if start <= end:
+        return month_mask(range(start, end + 1))
+    return month_mask(range(start, 13)) | month_mask(range(1, end + 1))
+
+
+def parse_banned_period(text: str) -> int | None:
+    """Turn a free-text ``Regulation.banned_period`` into a month mask, or None if it can't be read.
+
+    Comma-separated segments are combined, so "1월~2월, 7월" bans three months.
+    """
+    text = text.strip()
+    if text in NO_BANNED_PERIOD:
+        return 0
+    mask = 0
+    for segment in text.split(","):
+        match = BANNED_PERIOD_SEGMENT.match(segment.strip())
+        if match is None or not (match.group(2) or match.group(3)):
+            return None
+        start = int(match.group(1))
+        end = int(match.group(3) or start)
+        if not (1 <= start <= 12 and 1 <= end <= 12):
+            return None
+        mask |= month_range_mask(start, end)
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class RegulationRecord:
+    species_id: int
+    species_name: str
+    min_length: int
+    banned_period: str
+    banned_month_mask: int
+    fine: str
+
+    def is_banned_in(self, month: int) -> bool:
+        return bool(self.banned_month_mask >> (month - 1) & 1)
+
+
+@dataclass(frozen=True, slots=True)
+class RegionRegulations:
+    region_id: str
+    region: str
+    regulations: tuple[RegulationRecord, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FineRecord:
+    id: int
+    species: str
+    violation: str
+    fine_amount: str
+    legal_basis: str
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneRecord:
+    id: int
+    name: str
+    type: str
+    coordinates: tuple[tuple[float, ...], ...]
+    description: str
+    period: str
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceSnapshot:
+    version: int
+    loaded_at: datetime
+    species: tuple[SpeciesRecord, ...]
+    species_by_name: Mapping[str, SpeciesRecord]
+    regions: Mapping[str, RegionRegulations]
+    # Regional rules by (region_id, species_id); a species without one follows its national rule.
+    regulation_index: Mapping[tuple[str, int], RegulationRecord]
+    fines: tuple[FineRecord, ...]
+    zones: tuple[ZoneRecord, ...]
+    # Response bodies encoded from this snapshot, filled on first request per route.
+    encoded: dict[str, EncodedBody] = field(default_factory=dict)
+
+    def catch_rule(self, species: SpeciesRecord, region_id: str | None) -> SpeciesRecord | RegulationRecord:
+        """The rule a catch of ``species`` is checked against in ``region_id`` (national when None)."""
+        if region_id is None:
+            return species
+        return self.regulation_index.get((region_id, species.id), species)
+
+
+class ReferenceDataStore:
+    """Species, regulations, fines and zones held in memory as one immutable snapshot.
+
+    The tables only change when reference data is seeded or edited by an operator, so
+    routes read the current snapshot instead of the database. Reloading builds a new
+    snapshot with the next version number and swaps it in whole; readers never see a
+    half-built one. ``invalidate`` drops the snapshot so the next reader reloads it.
+    """
+
+    def __init__(self):
+        self.snapshot: ReferenceSnapshot | None = None
+        self.version = 0
+        self.lock = asyncio.Lock()
+
+    async def get(self) -> ReferenceSnapshot:
+        snapshot = self.snapshot
+        if snapshot is not None:
+            return snapshot
+        async with self.lock:
+            if self.snapshot is None:
+                await self._load()
+            return self.snapshot
+
+    async def reload(self) -> ReferenceSnapshot:
+        async with self.lock:
+            await self._load()
+            return self.snapshot
+
+    def invalidate(self) -> None:
+        self.snapshot = None
+
+    async def _load(self) -> None:
+        async with ReadSessionLocal() as db:
+            species_rows = (await db.scalars(select(FishSpecies).order_by(FishSpecies.id.asc()))).all()
+            regulation_rows = (
+                await db.execute(
+                    select(Regulation, FishSpecies.name)
+                    .join(FishSpecies, Regulation.species_id == FishSpecies.id)
+                    .order_by(Regulation.region_id.asc(), Regulation.id.asc())
+                )
+            ).all()
+            fine_rows = (await db.scalars(select(Fine).order_by(Fine.id.asc()))).all()
+            zone_rows = (await db.scalars(select(Zone).order_by(Zone.id.asc()))).all()
+
+        species = tuple(
+            SpeciesRecord(
+                id=row.id,
+                name=row.name,
+                min_length=row.min_length,
+                banned_months=tuple(row.banned_months or ()),
+                banned_month_mask=month_mask(row.banned_months or ()),
+                category=row.category,
+                fine=row.fine,
+            )
+            for row in species_rows
+        )
+
+        species_by_id = {record.id: record for record in species}
+        region_names: dict[str, str] = {}
+        region_regulations: dict[str, list[RegulationRecord]] = {}
+        regulation_index: dict[tuple[str, int], RegulationRecord] = {}
+        for regulation, species_name in regulation_rows:
+            banned_month_mask = parse_banned_period(regulation.banned_period)
+            if banned_month_mask is None:
+                logger.warning(
+                    "Unreadable banned period %r for %s/%s; using the national banned months",
+                    regulation.banned_period,
+                    regulation.region_id,
+                    species_name,
+                )
+                banned_month_mask = species_by_id[regulation.species_id].banned_month_mask
+            record = RegulationRecord(
+                species_id=regulation.species_id,
+                species_name=species_name,
+                min_length=regulation.min_length,
+                banned_period=regulation.banned_period,
+                banned_month_mask=banned_month_mask,
+                fine=regulation.fine,
+            )
+            region_names.setdefault(regulation.region_id, regulation.region)
+            region_regulations.setdefault(regulation.region_id, []).append(record)
+            regulation_index.setdefault((regulation.region_id, regulation.species_id), record)
+
+        self.version += 1
+        self.snapshot = ReferenceSnapshot(
+            version=self.version,
+            loaded_at=datetime.utcnow(),
+            species=species,
+            species_by_name=MappingProxyType({record.name: record for record in species}),
+            regions=MappingProxyType(
+                {
+                    region_id: RegionRegulations(
+                        region_id=region_id,
+                        region=region_names[region_id],
+                        regulations=tuple(records),
+                    )
+                    for region_id, records in region_regulations.items()
+                }
+            ),
+            regulation_index=MappingProxyType(regulation_index),
+            fines=tuple(
+                FineRecord(
+                    id=row.id,
+                    species=row.species,
+                    violation=row.violation,
+                    fine_amount=row.fine_amount,
+                    legal_basis=row.legal_basis,
+                )
+                for row in fine_rows
+            ),
+            zones=tuple(
+                ZoneRecord(
+                    id=row.id,
+                    name=row.name,
+                    type=row.type,
+                    coordinates=tuple(tuple(point) for point in row.coordinates),
+                    description=row.description,
+                    period=row.period,
+                )
+                for row in zone_rows
+            ),
+        )
+        logger.info(
+            "Loaded reference data v%d: %d species, %d regions, %d fines, %d zones",
+            self.version,
+            len(species),
+            len(region_regulations),
+            len(fine_rows),
+            len(zone_rows),
+        )
+
+
+reference_data = ReferenceDataStore()
@@ -2,56 +2,115 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.models import RefreshToken, TokenBlocklist
+from app.core.principal_cache import principal_cache
+from app.models import RefreshToken, User
 
 
-def create_refresh_token(db: Session, user_id: int) -> str:
-    raw_token = secrets.token_urlsafe(48)
-    token_hash = hash_token(raw_token)
-    expires_at = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+class RefreshTokenReuseError(Exception):
+    def __init__(self, user_id: int):
+        super().__init__(f"Revoked refresh token reused for user {user_id}")
+        self.user_id = user_id
+
 
-    db.add(RefreshToken(user_id=user_id, token_hash=token_hash, expires_at=expires_at))
-    db.commit()
+async def create_refresh_token(db: AsyncSession, user_id: int) -> str:
+    raw_token = _add_refresh_token(db, user_id)
+    await db.commit()
     return raw_token
 
 
-def rotate_refresh_token(db: Session, raw_token: str) -> RefreshToken | None:
+async def rotate_and_issue_refresh_token(db: AsyncSession, raw_token: str) -> tuple[User, str] | None:
     token_hash = hash_token(raw_token)
-    row = db.query(RefreshToken).filter(RefreshToken.token_hash == token_hash).first()
-    if not row:
-        return None
-
     now = datetime.utcnow()
-    if row.revoked_at is not None or row.expires_at < now:
-        return None
-
-    row.revoked_at = now
-    db.add(row)
-    db.commit()
-    db.refresh(row)
-    return row
-
-
-def revoke_refresh_token(db: Session, raw_token: str) -> bool:
+    user_id = (
+        await db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at >= now,
+            )
+            .values(revoked_at=now)
+            .returning(RefreshToken.user_id)
+        )
+    ).scalar_one_or_none()
+
+    if user_id is None:
+        row = (
+            await db.execute(
+                select(RefreshToken.user_id, RefreshToken.revoked_at).where(RefreshToken.token_hash == token_hash)
+            )
+        ).first()
+        if row is None or row.revoked_at is None:
+            await db.rollback()
+            return None
+
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == row.user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        await db.execute(update(User).where(User.id == row.user_id).values(token_version=User.token_version + 1))
+        await db.commit()
+        principal_cache.invalidate_user(row.user_id)
+        raise RefreshTokenReuseError(row.user_id)
+
+    user = await db.get(User, user_id)
+    new_raw_token = _add_refresh_token(db, user_id)
+    await db.commit()
+    return user, new_raw_token
+
+
+async def revoke_refresh_token(db: AsyncSession, raw_token: str) -> bool:
     token_hash = hash_token(raw_token)
-    row = db.query(RefreshToken).filter(RefreshToken.token_hash == token_hash).first()
+    row = await db.scalar(select(RefreshToken).where(RefreshToken.token_hash == token_hash))
     if not row or row.revoked_at is not None:
         return False
 
     row.revoked_at = datetime.utcnow()
     db.add(row)
-    db.commit()
+    await db.commit()
     return True
 
 
-def cleanup_expired_tokens(db: Session) -> None:
+async def revoke_all_refresh_tokens(db: AsyncSession, user_id: int) -> int:
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow())
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def bump_token_version(db: AsyncSession, user_id: int) -> None:
+    await db.execute(update(User).where(User.id == user_id).values(token_version=User.token_version + 1))
+    await db.commit()
+    principal_cache.invalidate_user(user_id)
+
+
+async def cleanup_expired_tokens(db: AsyncSession, batch_size: int) -> tuple[int, int]:
     now = datetime.utcnow()
-    db.query(TokenBlocklist).filter(TokenBlocklist.expires_at < now).delete(synchronize_session=False)
-    db.query(RefreshToken).filter(RefreshToken.expires_at < now).delete(synchronize_session=False)
-    db.commit()
+    deleted = 0
+    batches = 0
+    while True:
+        expired_ids = select(RefreshToken.id).where(RefreshToken.expires_at < now).limit(batch_size)
+        result = await db.execute(delete(RefreshToken).where(RefreshToken.id.in_(expired_ids.scalar_subquery())))
+        await db.commit()
+        batches += 1
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted, batches
+
+
+def _add_refresh_token(db: AsyncSession, user_id: int) -> str:
+    raw_token = secrets.token_urlsafe(48)
+    expires_at = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+    db.add(RefreshToken(user_id=user_id, token_hash=hash_token(raw_token), expires_at=expires_at))
+    return raw_token
 
 
 def hash_token(token: str) -> str:
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.token_service import cleanup_expired_tokens
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SweepStats:
+    started_at: datetime
+    finished_at: datetime
+    deleted: int
+    batches: int
+    error: str | None = None
+
+
+class TokenSweeper:
+    """Periodically deletes expired refresh tokens outside the request path."""
+
+    def __init__(self, interval_seconds: int, batch_size: int):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.last_run: SweepStats | None = None
+        self.task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run_forever(), name="token-sweeper")
+
+    async def stop(self) -> None:
+        if self.task is None:
+            return
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.task = None
+
+    async def run_once(self) -> SweepStats:
+        started_at = datetime.utcnow()
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted, batches = await cleanup_expired_tokens(db, self.batch_size)
+            stats = SweepStats(started_at=started_at, finished_at=datetime.utcnow(), deleted=deleted, batches=batches)
+        except Exception as exc:
+            logger.exception("Token sweep failed: %s", exc)
+            stats = SweepStats(
+                started_at=started_at,
+                finished_at=datetime.utcnow(),
+                deleted=0,
+                batches=0,
+                error=str(exc),
+            )
+        self.last_run = stats
+        return stats
+
+    async def _run_forever(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
+
+
+token_sweeper = TokenSweeper(
+    interval_seconds=settings.token_sweep_interval_seconds,
+    batch_size=settings.token_sweep_batch_size,
+)
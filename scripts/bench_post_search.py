@@ -0,0 +1,108 @@
+"""Post search latency: the FTS5 index against the LIKE fallback.
+
+Run from the repository root:
+
+    python -m scripts.bench_post_search                 # 1M posts
+    python -m scripts.bench_post_search --posts 100000
+
+Builds a scratch database of generated posts under the temp directory (the
+configured DATABASE_URL is ignored), builds the search index, then times the
+first page of ``GET /api/posts?search=...`` for each query through both paths.
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DIRECTORY = tempfile.mkdtemp(prefix="bench_post_search_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(DIRECTORY, 'bench.db')}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.setdefault("JWT_SECRET_KEY", "bench-only-secret-key-not-for-production-use")
+
+import orjson  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import Base, ReadSessionLocal, async_engine, engine, read_async_engine  # noqa: E402
+from app.core.pagination import PageParams  # noqa: E402
+from app.models.post import Post  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.routers.posts import list_posts  # noqa: E402
+from app.services.post_search import post_search_index  # noqa: E402
+
+
+WORDS = [
+    "감성돔", "우럭", "광어", "방파제", "선상", "낚시", "조황", "대박", "채비", "미끼",
+    "갯바위", "루어", "찌낚시", "입질", "물때", "포인트", "주말", "바람", "파도", "날씨",
+    "부산", "여수", "통영", "제주", "거제", "남해", "동해", "서해", "새벽", "오후",
+] + [f"단어{i}" for i in range(3000)]
+RARE_WORD = "희귀한참다랑어"
+QUERIES = ["감성돔 우럭", RARE_WORD, "없는검색어입니다", "단어1234"]
+
+
+def seed(posts: int) -> None:
+    random.seed(1)
+    started_at = datetime(2020, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(insert(User).values(id=1, nickname="bench"))
+        batch = []
+        for i in range(posts):
+            content = " ".join(random.choices(WORDS, k=15))
+            if i % 100_000 == 7:
+                content += f" {RARE_WORD}"
+            batch.append(
+                {
+                    "user_id": 1,
+                    "title": " ".join(random.choices(WORDS, k=3)),
+                    "content": content,
+                    "created_at": started_at + timedelta(seconds=i),
+                }
+            )
+            if len(batch) == 50_000:
+                connection.execute(insert(Post), batch)
+                batch = []
+        if batch:
+            connection.execute(insert(Post), batch)
+
+
+async def time_queries(repeat: int) -> None:
+    async with ReadSessionLocal() as db:
+        for query in QUERIES:
+            for mode in ("like", "fts"):
+                post_search_index.available = mode == "fts"
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    response = await list_posts(query, PageParams(cursor=None, limit=20), db)
+                elapsed = (time.perf_counter() - started) / repeat
+                hits = len(orjson.loads(response.body)["items"])
+                print(f"{query:<12} {mode}: {elapsed * 1000:9.1f} ms  ({hits} hits)")
+    await async_engine.dispose()
+    await read_async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    try:
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        seed(args.posts)
+        print(f"inserted {args.posts:,} posts in {time.perf_counter() - started:.1f}s")
+        started = time.perf_counter()
+        post_search_index.install(engine)
+        if not post_search_index.available:
+            raise SystemExit("FTS5 with the trigram tokenizer is not available in this SQLite build")
+        print(f"built search index in {time.perf_counter() - started:.1f}s")
+        asyncio.run(time_queries(args.repeat))
+    finally:
+        engine.dispose()
+        shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Rate limiter throughput and memory with many distinct client keys.
+
+Run from the repository root:
+
+    python -m scripts.bench_rate_limit                  # memory backend, 1M keys
+    python -m scripts.bench_rate_limit --backend sqlite --keys 200000
+
+Each key is hit once at the same instant (every request is allowed and adds a
+key), then a small set of hot keys is hit repeatedly, then the clock is moved
+past the period so the incremental sweep has to evict the idle keys. The sqlite
+backend writes to a scratch file under the temp directory, never to
+RATE_LIMIT_SQLITE_PATH.
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("JWT_SECRET_KEY", "bench-only-secret-key-not-for-production-use")
+
+from app.core.rate_limit import MemoryRateLimitBackend, RateLimitRule, SqliteRateLimitBackend  # noqa: E402
+
+
+def client_key(i: int) -> str:
+    return f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}#{i >> 24}"
+
+
+def bench_memory(keys: int) -> None:
+    rule = RateLimitRule("global", 120)
+    backend = MemoryRateLimitBackend()
+    names = [client_key(i) for i in range(keys)]
+    now = 1_000_000.0
+
+    started = time.perf_counter()
+    for name in names:
+        backend.hit(rule, name, now)
+    elapsed = time.perf_counter() - started
+
+    # Measure memory on a second table: tracing slows every allocation, so keep it out of the timing.
+    traced = MemoryRateLimitBackend()
+    tracemalloc.start()
+    for name in names:
+        traced.hit(rule, name, now)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+    print(f"distinct keys: {keys / elapsed:,.0f} hits/s, {used / keys:.0f} B/key, {len(backend):,} keys held")
+
+    hot = names[:1024]
+    started = time.perf_counter()
+    for i in range(keys):
+        backend.hit(rule, hot[i & 1023], now + i * 1e-6)
+    print(f"hot keys:      {keys / (time.perf_counter() - started):,.0f} hits/s")
+
+    # One call per sweep interval, once every entry is stale, walks the sweep through every shard.
+    started = time.perf_counter()
+    later = now + rule.period_seconds + 1
+    for i in range(len(backend.shards) * 2):
+        backend.hit(rule, "sweeper", later + i * backend.sweep_interval)
+    print(f"after one sweep cycle: {len(backend):,} keys held ({time.perf_counter() - started:.2f}s)")
+
+
+def bench_sqlite(keys: int) -> None:
+    rule = RateLimitRule("global", 120)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rate_limit.db")
+        backend = SqliteRateLimitBackend(path)
+        names = [client_key(i) for i in range(keys)]
+        now = 1_000_000.0
+
+        started = time.perf_counter()
+        for name in names:
+            backend.hit(rule, name, now)
+        elapsed = time.perf_counter() - started
+        backend.close()
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"distinct keys: {keys / elapsed:,.0f} hits/s, {size / keys:.0f} B/key on disk")
+
+        hot = names[:1024]
+        started = time.perf_counter()
+        for i in range(keys):
+            backend.hit(rule, hot[i & 1023], now + i * 1e-6)
+        print(f"hot keys:      {keys / (time.perf_counter() - started):,.0f} hits/s")
+
+        # Expired rows are deleted a batch per call; report the slowest call while draining them.
+        later = now + rule.period_seconds + 1
+        slowest = 0.0
+        calls = 0
+        started = time.perf_counter()
+        while True:
+            at = later + calls * 1e-3
+            call_started = time.perf_counter()
+            backend.hit(rule, "sweeper", at)
+            slowest = max(slowest, time.perf_counter() - call_started)
+            calls += 1
+            # A partial batch means the backlog is gone and the next sweep waits a full interval.
+            if backend.next_sweep_at > at:
+                break
+        backend.close()
+        print(
+            f"drained expired keys in {calls:,} calls ({time.perf_counter() - started:.2f}s), "
+            f"slowest call {slowest * 1000:.1f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=("memory", "sqlite"), default="memory")
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    args = parser.parse_args()
+    print(f"{args.backend} backend, {args.keys:,} keys")
+    if args.backend == "memory":
+        bench_memory(args.keys)
+    else:
+        bench_sqlite(args.keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+
+import pytest
+
+
+# Settings are read at import time, so point the app at a scratch database before any test imports it.
+# Assigned, not defaulted: an exported DATABASE_URL must never send the suite to a real database.
+_database_path = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["JWT_SECRET_KEY"] = "test-secret-key-that-is-at-least-32-characters"
+os.environ["DATABASE_URL"] = f"sqlite:///{_database_path}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{_database_path}"
+os.environ["SQL_INSTRUMENTATION_ENABLED"] = "true"
+os.environ["SQL_DEBUG_HEADERS"] = "true"
+os.environ["RATE_LIMIT_BACKEND"] = "memory"
+os.environ["GLOBAL_RATE_LIMIT_PER_MINUTE"] = "100000"
+os.environ["PRINCIPAL_CACHE_TTL_SECONDS"] = "3600"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO users (id, nickname, role, token_version, unread_notification_count, created_at) "
+                    "VALUES (1, 'angler', 'user', 0, 0, '2026-01-01')"
+                )
+            )
+        yield client
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client):
+    headers = {"Authorization": f"Bearer {create_access_token('1', 0)}"}
+    # Authenticate once so the principal is cached and later requests run only the route's own queries.
+    assert client.get("/api/profile", headers=headers).status_code == 200
+    return headers
+
+
+@pytest.fixture(scope="session")
+def post_id(client, auth_headers):
+    response = client.post("/api/posts", data={"title": "광어 조황", "content": "내용"}, headers=auth_headers)
+    assert response.status_code == 201
+    return response.json()["id"]
@@ -0,0 +1,70 @@
+import base64
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, decode_offset_cursor, encode_cursor, encode_offset_cursor
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def test_cursor_round_trip():
+    cursor = decode_cursor(encode_cursor(datetime(2026, 1, 1, 12, 30), 42))
+    assert (cursor.created_at, cursor.id) == (datetime(2026, 1, 1, 12, 30), 42)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "2026-01-01T00:00:00|99999999999999999999999",
+        "2026-01-01T00:00:00|9223372036854775808",
+        "2026-01-01T00:00:00|0",
+        "2026-01-01T00:00:00|-1",
+        "not-a-date|1",
+        "2026-01-01T00:00:00",
+    ],
+)
+def test_forged_cursor_is_rejected(raw):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(_b64(raw))
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["code"] == "INVALID_CURSOR"
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/api/posts", "/api/posts/{post_id}/comments", "/api/reports", "/api/points", "/api/notifications"],
+)
+def test_overflowing_cursor_returns_400(client, auth_headers, post_id, path):
+    response = client.get(
+        path.format(post_id=post_id),
+        params={"cursor": _b64("2026-01-01T00:00:00|99999999999999999999999")},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_CURSOR"
+
+
+def test_offset_cursor_round_trip():
+    assert decode_offset_cursor(None) == 0
+    assert decode_offset_cursor(encode_offset_cursor(40)) == 40
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["offset|99999999999999999999999", "offset|9223372036854775807", "offset|-1", "offset|x", "page|1"],
+)
+def test_forged_offset_cursor_is_rejected(raw):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_offset_cursor(_b64(raw))
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["code"] == "INVALID_CURSOR"
+
+
+def test_overflowing_search_cursor_returns_400(client):
+    response = client.get("/api/posts", params={"search": "abcd", "cursor": _b64("offset|99999999999999999999999")})
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_CURSOR"
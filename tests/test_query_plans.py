@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import async_engine, engine, read_async_engine
+from app.core.pagination import encode_cursor
+
+
+CURSOR = encode_cursor(datetime(2026, 1, 1), 10)
+
+# (method, path, query params, indexes the route's statements must use, whether a temp B-tree is expected)
+ROUTES = {
+    "GET /posts": ("GET", "/api/posts", {}, ["ix_posts_created_at"], False),
+    "GET /posts cursor": ("GET", "/api/posts", {"cursor": CURSOR}, ["ix_posts_created_at"], False),
+    # Relevance order is computed per match, so ranking sorts the matched rows; the MATCH itself must hit the index.
+    "GET /posts?search=": ("GET", "/api/posts", {"search": "광어 조황"}, ["posts_fts VIRTUAL TABLE INDEX"], True),
+    "GET /posts/{id}": ("GET", "/api/posts/{post_id}", {}, ["ix_comments_post_id_created_at"], False),
+    "GET /posts/{id}/comments": ("GET", "/api/posts/{post_id}/comments", {}, ["ix_comments_post_id_created_at"], False),
+    "GET /posts/{id}/comments cursor": (
+        "GET",
+        "/api/posts/{post_id}/comments",
+        {"cursor": CURSOR},
+        ["ix_comments_post_id_created_at"],
+        False,
+    ),
+    "GET /reports": ("GET", "/api/reports", {}, ["ix_reports_created_at"], False),
+    "GET /reports cursor": ("GET", "/api/reports", {"cursor": CURSOR}, ["ix_reports_created_at"], False),
+    "GET /reports?status=": ("GET", "/api/reports", {"status": "pending"}, ["ix_reports_status_created_at"], False),
+    "GET /points": ("GET", "/api/points", {}, ["ix_points_user_id_created_at"], False),
+    "GET /points cursor": ("GET", "/api/points", {"cursor": CURSOR}, ["ix_points_user_id_created_at"], False),
+    "GET /notifications": ("GET", "/api/notifications", {}, ["ix_notifications_user_id_created_at"], False),
+    "GET /notifications cursor": (
+        "GET",
+        "/api/notifications",
+        {"cursor": CURSOR},
+        ["ix_notifications_user_id_created_at"],
+        False,
+    ),
+    "PUT /notifications/read-all": ("PUT", "/api/notifications/read-all", {}, ["ix_notifications_user_id_is_read"], False),
+}
+
+
+@contextmanager
+def captured_statements():
+    """Collect every statement (with its bound parameters) the app sends to the database."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((statement, parameters))
+
+    engines = {engine, async_engine.sync_engine, read_async_engine.sync_engine}
+    for target in engines:
+        event.listen(target, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", record)
+
+
+@pytest.mark.parametrize("route", list(ROUTES))
+def test_route_query_uses_index(client, auth_headers, post_id, route):
+    method, path, params, index_names, temp_btree_expected = ROUTES[route]
+    with captured_statements() as statements:
+        response = client.request(method, path.format(post_id=post_id), params=params, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert statements
+
+    plans = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            plans.append((statement, plan))
+
+    for index_name in index_names:
+        assert any(index_name in step for _, plan in plans for step in plan), plans
+    for statement, plan in plans:
+        for step in plan:
+            if not temp_btree_expected:
+                assert "TEMP B-TREE" not in step, (statement, plan)
+            # A SCAN is only acceptable as an ordered index walk that stops at the LIMIT,
+            # or as an FTS lookup, which SQLite reports as a virtual table scan.
+            if step.startswith("SCAN "):
+                assert any(
+                    marker in step for marker in (" USING INDEX ", " USING COVERING INDEX ", " VIRTUAL TABLE INDEX ")
+                ), (statement, plan)
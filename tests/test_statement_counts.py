@@ -0,0 +1,36 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body", "expected"),
+    [
+        ("GET", "/api/regulations", None, 0),
+        ("GET", "/api/regulations/busan", None, 0),
+        ("GET", "/api/fish/species", None, 0),
+        ("GET", "/api/fines", None, 0),
+        ("GET", "/api/zones", None, 0),
+        ("POST", "/api/fish/check", {"species": "우럭", "length": 30}, 0),
+        ("POST", "/api/fish/check/batch", {"items": [{"species": "우럭", "length": 30}] * 50}, 0),
+    ],
+)
+def test_reference_routes_do_not_query(client, method, path, body, expected):
+    response = client.request(method, path, json=body)
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Statements"]) == expected
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/api/posts", 1),
+        ("/api/posts/{post_id}", 2),
+        ("/api/posts/{post_id}/comments", 2),
+        ("/api/notifications", 1),
+        ("/api/notifications/unread-count", 1),
+        ("/api/points", 1),
+    ],
+)
+def test_route_statement_count(client, auth_headers, post_id, path, expected):
+    response = client.get(path.format(post_id=post_id), headers=auth_headers)
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Statements"]) == expected